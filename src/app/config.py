@@ -50,8 +50,11 @@ class PixelCheck:
 class PollerConfig:
     """Configuration for the state polling worker."""
     poll_frequency_hz: float = 10.0  # Polls per second
+    hot_interval: float = 1.0 / 30  # Poll interval while a hand is starting or cards are being read
+    idle_interval: float = 0.2  # Poll interval when no table shows a dealer button
     debounce_ms: int = 100  # Debounce time in milliseconds
     max_consecutive_errors: int = 5  # Max errors before backing off
+    async_capture: bool = False  # Grab the screen on a background thread, crop windows from latest frame
 
 
 @dataclass
@@ -179,7 +179,7 @@ class PlutosApp:
                     info=registered.info,
                     config=self.config.default_table
                 )
-                self._window_registry._windows[registered.window_id] = table_window
+                self._window_registry.add_window(table_window)
                 self._setup_single_window(table_window)
                 logger.info(f"Monitor {self.config.use_monitor} registered successfully")
             else:
@@ -4,11 +4,19 @@ Provides window-relative capture for multi-monitor and multi-window support.
 """
 from typing import Optional, Tuple
 import logging
+import threading
+import time
 
 import mss
 import numpy as np
 from PIL import Image
 
+try:
+    import bettercam
+    HAS_BETTERCAM = True
+except ImportError:
+    HAS_BETTERCAM = False
+
 from ..app.config import Region
 
 
@@ -18,17 +26,26 @@ logger = logging.getLogger(__name__)
 class ScreenCapture:
     """
     Screen capture utility using MSS.
-    Thread-safe - each instance maintains its own mss context.
+    Thread-safe - each calling thread gets its own mss context, since mss
+    handles can't be shared across threads. mss calls BitBlt/GetDIBits
+    through ctypes, which drops the GIL for the duration of the call, so
+    grabs from pool threads overlap without a native extension.
     """
     
     def __init__(self):
-        self._sct = None
+        self._local = threading.local()
+        self._all_scts = []
+        self._scts_lock = threading.Lock()
     
     def _get_sct(self) -> mss.mss:
-        """Get or create mss instance."""
-        if self._sct is None:
-            self._sct = mss.mss()
-        return self._sct
+        """Get or create the calling thread's mss instance."""
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+            with self._scts_lock:
+                self._all_scts.append(sct)
+        return sct
     
     def capture_region(
         self,
@@ -66,6 +83,67 @@ class ScreenCapture:
             logger.error(f"Unexpected capture error: {e}")
             return None
     
+    def capture_region_array(
+        self,
+        region: Region,
+        window_offset: Tuple[int, int] = (0, 0)
+    ) -> Optional[np.ndarray]:
+        """
+        Capture a screen region and return it as an RGB NumPy array.
+        
+        Unlike capture_region, no PIL image is built - the returned array
+        is a channel-reordered view over the raw BGRA grab.
+        
+        Args:
+            region: Region to capture (relative coordinates)
+            window_offset: (x, y) offset to add for window-relative capture
+        
+        Returns:
+            uint8 array of shape (height, width, 3) or None if capture failed
+        """
+        abs_left = region.left + window_offset[0]
+        abs_top = region.top + window_offset[1]
+        
+        monitor = {
+            "left": abs_left,
+            "top": abs_top,
+            "width": region.width,
+            "height": region.height,
+        }
+        
+        try:
+            sct = self._get_sct()
+            sct_img = sct.grab(monitor)
+            # MSS returns BGRA - reverse the first three channels to get RGB
+            return np.asarray(sct_img)[:, :, 2::-1]
+        except mss.exception.ScreenShotError as e:
+            logger.error(f"Screen capture failed at ({abs_left}, {abs_top}): {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected capture error: {e}")
+            return None
+    
+    def capture_full_window(
+        self,
+        window_offset: Tuple[int, int],
+        size: Tuple[int, int]
+    ) -> Optional[np.ndarray]:
+        """
+        Capture a window's whole client area as one RGB array.
+        
+        Regions can then be cut from it with crop_region instead of
+        issuing a screen grab per region.
+        
+        Args:
+            window_offset: (x, y) screen offset of window client area
+            size: (width, height) of the client area
+        
+        Returns:
+            uint8 array of shape (height, width, 3) or None if capture failed
+        """
+        width, height = size
+        return self.capture_region_array(Region(0, 0, width, height), window_offset)
+    
     def capture_pixel(
         self,
         x: int,
@@ -127,13 +205,15 @@ class ScreenCapture:
         return results
     
     def close(self):
-        """Release resources."""
-        if self._sct is not None:
+        """Release resources of every thread's mss instance."""
+        with self._scts_lock:
+            scts, self._all_scts = self._all_scts, []
+        for sct in scts:
             try:
-                self._sct.close()
+                sct.close()
             except (AttributeError, Exception):
                 pass  # Thread-local cleanup may fail
-            self._sct = None
+        self._local = threading.local()
     
     def __enter__(self):
         return self
@@ -142,6 +222,170 @@ class ScreenCapture:
         self.close()
 
 
+class LatestFrameCapture:
+    """
+    Background screen capture into a single-slot latest-frame buffer.
+    
+    A dedicated thread grabs the screen at target_fps; pollers crop their
+    windows from the most recent frame instead of grabbing synchronously.
+    Uses bettercam (DXGI desktop duplication) when installed and there
+    is a single monitor, otherwise mss over the whole virtual screen.
+    """
+    
+    def __init__(self, target_fps: float = 20.0):
+        """
+        Initialize capturer.
+        
+        Args:
+            target_fps: Background grab rate
+        """
+        self.target_fps = target_fps
+        
+        # (frame, (origin_x, origin_y)) - replaced atomically by the grab thread
+        self._latest: Optional[Tuple[np.ndarray, Tuple[int, int]]] = None
+        self._camera = None
+        self._camera_origin = (0, 0)  # Screen position of the camera output
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+    
+    def _grab_loop(self):
+        """Grab the virtual screen with mss until stopped."""
+        interval = 1.0 / self.target_fps
+        
+        with mss.mss() as sct:
+            monitor = sct.monitors[0]  # Union of all monitors
+            origin = (monitor["left"], monitor["top"])
+            
+            while self._running:
+                start_time = time.time()
+                try:
+                    sct_img = sct.grab(monitor)
+                    self._latest = (np.asarray(sct_img)[:, :, 2::-1], origin)
+                except Exception as e:
+                    logger.error(f"Background capture error: {e}")
+                
+                sleep_time = interval - (time.time() - start_time)
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+    
+    def start(self):
+        """Start background capture."""
+        if self._running:
+            return
+        
+        self._running = True
+        
+        # bettercam duplicates one output only, and its index needn't match
+        # a given monitor - with several monitors, windows elsewhere would be
+        # cropped from the wrong place, so use mss over the virtual screen
+        with mss.mss() as sct:
+            monitors = sct.monitors[1:]
+        if HAS_BETTERCAM and len(monitors) == 1:
+            self._camera_origin = (monitors[0]["left"], monitors[0]["top"])
+            self._camera = bettercam.create(output_idx=0, output_color="RGB")
+            self._camera.start(target_fps=int(self.target_fps), video_mode=True)
+            logger.info(f"Background capture started (bettercam, {self.target_fps:.0f} fps)")
+            return
+        
+        self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._thread.start()
+        logger.info(f"Background capture started (mss, {self.target_fps:.0f} fps)")
+    
+    def stop(self):
+        """Stop background capture."""
+        self._running = False
+        
+        if self._camera is not None:
+            self._camera.stop()
+            self._camera = None
+        
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        
+        self._latest = None
+    
+    def get_latest_frame(self) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+        """
+        Get the most recent frame.
+        
+        Returns:
+            (RGB frame, (origin_x, origin_y) screen position of its top-left)
+            or None if no frame was captured yet
+        """
+        if self._camera is not None:
+            frame = self._camera.get_latest_frame()
+            return (frame, self._camera_origin) if frame is not None else None
+        return self._latest
+    
+    def crop_window(
+        self,
+        window_offset: Tuple[int, int],
+        size: Tuple[int, int]
+    ) -> Optional[np.ndarray]:
+        """
+        Cut a window's client area out of the latest frame (no copy).
+        
+        Args:
+            window_offset: (x, y) screen offset of window client area
+            size: (width, height) of the client area
+        
+        Returns:
+            RGB array like capture_full_window, or None if no frame is
+            available or the window is not fully inside it
+        """
+        latest = self.get_latest_frame()
+        if latest is None:
+            return None
+        
+        frame, (origin_x, origin_y) = latest
+        width, height = size
+        left = window_offset[0] - origin_x
+        top = window_offset[1] - origin_y
+        
+        if left < 0 or top < 0:
+            return None
+        return crop_region(frame, Region(left, top, width, height))
+
+
+def crop_region(frame: np.ndarray, region: Region) -> Optional[np.ndarray]:
+    """
+    Get a window-relative region from a full-window frame (no copy).
+    
+    Args:
+        frame: RGB array from capture_full_window
+        region: Region relative to window origin
+    
+    Returns:
+        Array view of the region, or None if it lies outside the frame
+    """
+    crop = frame[region.top:region.top + region.height, region.left:region.left + region.width]
+    if crop.shape[0] != region.height or crop.shape[1] != region.width:
+        return None
+    return crop
+
+
+def crop_region_image(frame: np.ndarray, region: Region) -> Optional[Image.Image]:
+    """Like crop_region, but returns a PIL Image."""
+    crop = crop_region(frame, region)
+    if crop is None:
+        return None
+    return Image.fromarray(np.ascontiguousarray(crop))
+
+
+def frame_pixel(frame: np.ndarray, x: int, y: int) -> Optional[Tuple[int, int, int]]:
+    """
+    Get a window-relative pixel from a full-window frame.
+    
+    Returns:
+        (R, G, B) tuple or None if the pixel lies outside the frame
+    """
+    if not (0 <= y < frame.shape[0] and 0 <= x < frame.shape[1]):
+        return None
+    r, g, b = frame[y, x]
+    return (int(r), int(g), int(b))
+
+
 # Module-level convenience instance
 _default_capture: Optional[ScreenCapture] = None
 
@@ -25,14 +25,27 @@ GetClientRect = user32.GetClientRect
 ClientToScreen = user32.ClientToScreen
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowInfo:
-    """Information about a poker window."""
+    """
+    Information about a poker window.
+    
+    Immutable - a moved window gets a new WindowInfo, so the screen offset
+    is computed once here rather than on every capture.
+    """
     hwnd: int
     title: str
     rect: Tuple[int, int, int, int]  # left, top, right, bottom (screen coords)
     client_offset: Tuple[int, int]   # client area offset from window origin
     client_size: Tuple[int, int]     # client area width, height
+    # Client-area origin in screen coords, set in __post_init__
+    _screen_offset: Tuple[int, int] = field(init=False, compare=False, repr=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_screen_offset", (
+            self.rect[0] + self.client_offset[0],
+            self.rect[1] + self.client_offset[1],
+        ))
     
     @property
     def left(self) -> int:
@@ -62,7 +75,7 @@ class WindowInfo:
     
     def get_screen_offset(self) -> Tuple[int, int]:
         """Get offset to convert window-relative coords to screen coords."""
-        return (self.client_left, self.client_top)
+        return self._screen_offset
 
 
 @dataclass
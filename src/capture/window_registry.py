@@ -16,7 +16,7 @@ from ..app.config import TableConfig, DATA_DIR
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableWindow:
     """
     A tracked poker table window with its configuration.
@@ -79,6 +79,8 @@ class WindowRegistry:
         
         self._manager = WindowManager(max_windows, title_pattern)
         self._windows: Dict[str, TableWindow] = {}
+        # Same windows keyed by hwnd, kept in step with _windows
+        self._by_hwnd: Dict[int, TableWindow] = {}
         self._window_counter = 0
     
     def discover_windows(self) -> List[TableWindow]:
@@ -97,7 +99,7 @@ class WindowRegistry:
                 break
             
             # Check if already registered
-            if any(w.info.hwnd == info.hwnd for w in self._windows.values()):
+            if info.hwnd in self._by_hwnd:
                 continue
             
             # Generate window ID
@@ -115,7 +117,7 @@ class WindowRegistry:
                 calibration_path=self.calibrations_dir / f"{info.hwnd}.json",
             )
             
-            self._windows[window_id] = table_window
+            self.add_window(table_window)
             newly_registered.append(table_window)
             
             logger.info(
@@ -125,16 +127,23 @@ class WindowRegistry:
         
         return newly_registered
     
+    def add_window(self, table_window: TableWindow):
+        """
+        Register an already built TableWindow (e.g. a monitor in monitor mode).
+        
+        Args:
+            table_window: Window to track under its window_id and hwnd
+        """
+        self._windows[table_window.window_id] = table_window
+        self._by_hwnd[table_window.info.hwnd] = table_window
+    
     def get_window(self, window_id: str) -> Optional[TableWindow]:
         """Get window by ID."""
         return self._windows.get(window_id)
     
     def get_window_by_hwnd(self, hwnd: int) -> Optional[TableWindow]:
         """Get window by handle."""
-        for window in self._windows.values():
-            if window.info.hwnd == hwnd:
-                return window
-        return None
+        return self._by_hwnd.get(hwnd)
     
     def get_all_windows(self) -> List[TableWindow]:
         """Get all registered windows."""
@@ -146,8 +155,10 @@ class WindowRegistry:
     
     def unregister_window(self, window_id: str):
         """Remove a window from the registry."""
-        if window_id in self._windows:
-            del self._windows[window_id]
+        window = self._windows.pop(window_id, None)
+        if window is not None:
+            if self._by_hwnd.get(window.info.hwnd) is window:
+                del self._by_hwnd[window.info.hwnd]
             logger.info(f"Unregistered window: {window_id}")
     
     def refresh_all(self) -> int:
@@ -270,13 +281,17 @@ class WindowRegistry:
         Args:
             max_errors: Maximum errors before removal
         """
-        to_remove = [
-            w.window_id for w in self._windows.values()
-            if w.error_count >= max_errors
-        ]
+        # Single pass: rebuild the kept windows instead of deleting in place
+        kept: Dict[str, TableWindow] = {}
+        for window_id, window in self._windows.items():
+            if window.error_count < max_errors:
+                kept[window_id] = window
+                continue
+            if self._by_hwnd.get(window.info.hwnd) is window:
+                del self._by_hwnd[window.info.hwnd]
+            logger.info(f"Unregistered window: {window_id}")
         
-        for window_id in to_remove:
-            self.unregister_window(window_id)
+        self._windows = kept
 
 
 # Module-level singleton
@@ -9,6 +9,7 @@ from .models import (
     BoardCards,
     Observation,
     PreflopDecision,
+    ALL_HANDS,
 )
 
 from .preflop_engine import (
@@ -37,6 +38,7 @@ __all__ = [
     "BoardCards",
     "Observation",
     "PreflopDecision",
+    "ALL_HANDS",
     # Engines
     "PreflopEngine",
     "RangesBasedEngine",
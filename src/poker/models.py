@@ -5,8 +5,41 @@ All models are immutable dataclasses with validation.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
+from functools import lru_cache
 from typing import List, Optional
 import json
+import operator
+import sys
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# UI suit names/symbols -> suit letter (Card.from_ui_format)
+_UI_SUIT_MAP = {
+    "♠": "s", "spade": "s", "spades": "s",
+    "♥": "h", "heart": "h", "hearts": "h",
+    "♦": "d", "diamond": "d", "diamonds": "d",
+    "♣": "c", "club": "c", "clubs": "c",
+}
+
+# Enum -> stored string, bound once for map() over position lists
+_value_getter = operator.attrgetter("value")
+
+
+def _dumps(obj) -> str:
+    """
+    Serialize to a compact JSON string, using orjson when available.
+    
+    The stdlib fallback uses orjson's separators so stored JSON is the
+    same bytes whichever backend is installed.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
 
 
 class Stage(Enum):
@@ -44,7 +77,48 @@ class Position(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass(frozen=True)
+# Index tables for Card.id
+_RANK_INDEX = {rank: i for i, rank in enumerate("23456789TJQKA")}
+_SUIT_INDEX = {suit: i for i, suit in enumerate("shdc")}
+
+def _build_hand_notation() -> tuple:
+    """
+    Canonical hand notation for every (high rank, low rank, suited) key.
+    
+    Strings are interned so range-set probes match the (interned) literals
+    in preflop_ranges by identity.
+    """
+    table: List[Optional[str]] = [None] * (13 * 13 * 2)
+    ranks = "23456789TJQKA"
+    for hi, hi_rank in enumerate(ranks):
+        for lo, lo_rank in enumerate(ranks[:hi + 1]):
+            key = (hi * 13 + lo) * 2
+            if hi == lo:
+                table[key] = table[key + 1] = hi_rank * 2
+            else:
+                table[key] = f"{hi_rank}{lo_rank}o"
+                table[key + 1] = f"{hi_rank}{lo_rank}s"
+    return tuple(sys.intern(h) if h else h for h in table)
+
+
+# Cactus Kev card integers (the layout treys' Card.new produces), by Card.id:
+# rank bit << 16 | suit bit << 12 | rank index << 8 | rank prime
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_CARD_CODES = tuple(
+    (1 << (16 + rank)) | (1 << (12 + suit)) | (rank << 8) | _RANK_PRIMES[rank]
+    for rank in range(13)
+    for suit in range(4)
+)
+# Suit bits of a card code - two cards are suited iff their codes share one
+_SUIT_MASK = 0xF000
+
+# 169 canonical hands ("AA", "AKs", "AKo", ...) indexed by
+# (high_rank * 13 + low_rank) * 2 + suited
+_HAND_NOTATION = _build_hand_notation()
+_CANONICAL_HANDS = frozenset(_HAND_NOTATION) - {None}
+
+
+@dataclass(frozen=True, slots=True)
 class Card:
     """
     A single card representation.
@@ -56,6 +130,11 @@ class Card:
     rank: str
     suit: str
     
+    # Integer id 0..51 (rank_index * 4 + suit_index), set in __post_init__
+    id: int = field(init=False, compare=False, repr=False)
+    # treys-compatible 32-bit card integer, set in __post_init__
+    code: int = field(init=False, compare=False, repr=False)
+    
     VALID_RANKS = frozenset("23456789TJQKA")
     VALID_SUITS = frozenset("shdc")
     
@@ -64,6 +143,18 @@ class Card:
             raise ValueError(f"Invalid rank: {self.rank}")
         if self.suit not in self.VALID_SUITS:
             raise ValueError(f"Invalid suit: {self.suit}")
+        card_id = _RANK_INDEX[self.rank] * 4 + _SUIT_INDEX[self.suit]
+        object.__setattr__(self, "id", card_id)
+        object.__setattr__(self, "code", _CARD_CODES[card_id])
+    
+    # Hash/equality on the precomputed id - cheap int ops for set/dict keys
+    def __hash__(self) -> int:
+        return self.id
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Card):
+            return self.id == other.id
+        return NotImplemented
     
     def __str__(self) -> str:
         return f"{self.rank}{self.suit}"
@@ -72,7 +163,9 @@ class Card:
         """Convert to treys library format."""
         return str(self)
     
+    # Cards are immutable, so parsed results are cached and shared
     @classmethod
+    @lru_cache(maxsize=256)
     def from_string(cls, card_str: str) -> "Card":
         """
         Parse card from string like 'Ah', 'Ts', '2c'.
@@ -85,18 +178,12 @@ class Card:
         return cls(rank=card_str[0].upper(), suit=card_str[1].lower())
     
     @classmethod
+    @lru_cache(maxsize=256)
     def from_ui_format(cls, ui_str: str) -> "Card":
         """
         Parse card from UI format like 'K heart' or 'A spade'.
         Maps Unicode suits to letters.
         """
-        suit_map = {
-            "♠": "s", "spade": "s", "spades": "s",
-            "♥": "h", "heart": "h", "hearts": "h",
-            "♦": "d", "diamond": "d", "diamonds": "d",
-            "♣": "c", "club": "c", "clubs": "c",
-        }
-        
         ui_str = ui_str.strip()
         if len(ui_str) < 2:
             raise ValueError(f"Invalid UI card format: {ui_str}")
@@ -110,21 +197,41 @@ class Card:
             suit_part = ui_str[1:].strip().lower()
         
         # Map suit
-        suit = suit_map.get(suit_part, suit_part)
+        suit = _UI_SUIT_MAP.get(suit_part, suit_part)
         if len(suit) > 1:
-            suit = suit_map.get(suit, "")
+            suit = _UI_SUIT_MAP.get(suit, "")
         
         return cls(rank=rank, suit=suit)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HoleCards:
-    """Hero's hole cards (exactly 2 cards)."""
+    """
+    Hero's hole cards (exactly 2 cards).
+    
+    Cards are normalized on construction so card1 is always the higher
+    card (by rank, then suit); the pair reads e.g. "AsKh" whichever
+    order the screen produced it in.
+    """
     card1: Card
     card2: Card
+    # Formatted once - str() is hit on every vote and debug update
+    _str: str = field(init=False, compare=False, repr=False)
+    
+    def __post_init__(self):
+        if self.card1.id < self.card2.id:
+            card1, card2 = self.card2, self.card1
+            object.__setattr__(self, "card1", card1)
+            object.__setattr__(self, "card2", card2)
+        object.__setattr__(self, "_str", f"{self.card1}{self.card2}")
     
     def __str__(self) -> str:
-        return f"{self.card1}{self.card2}"
+        return self._str
+    
+    @property
+    def id(self) -> int:
+        """Order-independent integer key for the pair (0..52*52-1)."""
+        return self.card2.id * 52 + self.card1.id
     
     def to_list(self) -> List[str]:
         """Convert to list of treys format strings."""
@@ -136,25 +243,50 @@ class HoleCards:
     
     def is_suited(self) -> bool:
         """Check if cards are suited."""
-        return self.card1.suit == self.card2.suit
+        return (self.card1.code & self.card2.code & _SUIT_MASK) != 0
     
     def hand_notation(self) -> str:
         """
         Get standard hand notation like 'AKs', 'TT', 'Q9o'.
         """
-        ranks = sorted([self.card1.rank, self.card2.rank],
-                       key=lambda r: "23456789TJQKA".index(r),
-                       reverse=True)
+        # Card.id = rank_index * 4 + suit_index; card1 is the higher card
+        id1, id2 = self.card1.id, self.card2.id
+        suited = (id1 & 3) == (id2 & 3)
+        return _HAND_NOTATION[((id1 >> 2) * 13 + (id2 >> 2)) * 2 + suited]
+    
+    @classmethod
+    def from_notation(cls, notation: str) -> "HoleCards":
+        """
+        Build a canonical representative of a hand like 'AKs', 'TT', 'Q9o'.
         
-        if self.is_pocket_pair():
-            return f"{ranks[0]}{ranks[1]}"
-        elif self.is_suited():
-            return f"{ranks[0]}{ranks[1]}s"
-        else:
-            return f"{ranks[0]}{ranks[1]}o"
+        Suited hands use spades for both cards; pairs and offsuit hands use
+        spades and hearts.
+        
+        Args:
+            notation: One of the 169 canonical hand notations
+        
+        Returns:
+            HoleCards with that notation
+        """
+        if notation not in _CANONICAL_HANDS:
+            raise ValueError(f"Invalid hand notation: {notation}")
+        suit2 = "s" if notation.endswith("s") else "h"
+        return cls(
+            card1=Card(rank=notation[0], suit="s"),
+            card2=Card(rank=notation[1], suit=suit2),
+        )
 
 
-@dataclass(frozen=True)
+# One representative HoleCards per canonical hand (169), built once at import,
+# ordered by hand_notation table key (low ranks first, offsuit before suited)
+ALL_HANDS = tuple(
+    HoleCards.from_notation(notation)
+    for notation in dict.fromkeys(_HAND_NOTATION)
+    if notation is not None
+)
+
+
+@dataclass(frozen=True, slots=True)
 class BoardCards:
     """Community cards on the board (0-5 cards)."""
     cards: tuple  # Tuple of Card objects
@@ -193,7 +325,7 @@ class BoardCards:
         return cls(cards=tuple())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Observation:
     """
     A snapshot of the poker table state at a point in time.
@@ -221,6 +353,31 @@ class Observation:
     # Raw recognition confidence for debugging
     confidence: Optional[dict] = None
     
+    # Lazily built serializations (observation is immutable, so build once)
+    _db_fields: Optional[dict] = field(default=None, init=False, compare=False, repr=False)
+    _json: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+    
+    def to_db_json(self) -> dict:
+        """
+        Get column values for the observations table.
+        
+        The observations-table column strings are built once per instance
+        and cached; event payloads use to_json's separate cache.
+        
+        Returns:
+            Dict with stage, hero_position and the *_json column strings
+        """
+        if self._db_fields is None:
+            object.__setattr__(self, "_db_fields", {
+                "stage": self.stage.value,
+                "hero_position": self.hero_position.value,
+                "active_positions_json": _dumps(list(map(_value_getter, self.active_positions))),
+                "hero_cards_json": str(self.hero_cards) if self.hero_cards else None,
+                "board_cards_json": _dumps(self.board_cards.to_list()),
+                "raw_confidence_json": _dumps(self.confidence) if self.confidence else None,
+            })
+        return self._db_fields
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -239,11 +396,13 @@ class Observation:
         }
     
     def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        """Convert to JSON string (cached after first call)."""
+        if self._json is None:
+            object.__setattr__(self, "_json", _dumps(self.to_dict()))
+        return self._json
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreflopDecision:
     """Recommended preflop action."""
     action: Action
@@ -5,7 +5,8 @@ Handles conversion between seat indices and position names based on dealer locat
 9-max MTT positions: UTG, UTG+1, UTG+2, LJ, HJ, CO, BTN, SB, BB
 8-max positions: UTG, UTG+1, LJ, HJ, CO, BTN, SB, BB
 """
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from .models import Position
 
 
@@ -71,6 +72,7 @@ def get_positions_for_table_size(total_seats: int) -> List[Position]:
         return POSITIONS_9MAX
 
 
+@lru_cache(maxsize=256)
 def get_position_from_seat(
     seat_index: int,
     dealer_seat: int,
@@ -103,6 +105,7 @@ def get_position_from_seat(
     return Position.UNKNOWN
 
 
+@lru_cache(maxsize=256)
 def get_hero_position(
     hero_seat: int,
     dealer_seat: int,
@@ -138,10 +141,59 @@ def get_active_positions(
     Returns:
         List of Position enum values
     """
-    return [
+    return list(get_active_positions_tuple(tuple(active_seat_indices), dealer_seat, total_seats))
+
+
+@lru_cache(maxsize=1024)
+def get_active_positions_tuple(
+    active_seat_indices: Tuple[int, ...],
+    dealer_seat: int,
+    total_seats: int = 8
+) -> Tuple[Position, ...]:
+    """
+    Cached, immutable variant of get_active_positions for the poll loop.
+    
+    Args:
+        active_seat_indices: Tuple of seat indices with active players
+        dealer_seat: Dealer button seat index
+        total_seats: Total number of seats
+    
+    Returns:
+        Tuple of Position enum values
+    """
+    return tuple(
         get_position_from_seat(seat, dealer_seat, total_seats)
         for seat in active_seat_indices
-    ]
+    )
+
+
+# Position of every seat for each (table size, dealer seat), built once at
+# import: _POSITION_TABLES[total_seats][dealer_seat][seat_index].
+# Uses the uncached function so building it doesn't churn the lru_cache.
+_POSITION_TABLES = {
+    total: tuple(
+        tuple(get_position_from_seat.__wrapped__(seat, dealer, total) for seat in range(total))
+        for dealer in range(total)
+    )
+    for total in range(1, 10)
+}
+
+
+def get_positions_for_table(dealer_seat: int, total_seats: int = 8) -> Tuple[Position, ...]:
+    """
+    Get the position of every seat at once for a dealer location.
+    
+    Args:
+        dealer_seat: Dealer button seat index (0-based)
+        total_seats: Total number of seats at the table (1-9)
+    
+    Returns:
+        Tuple of Position enums indexed by seat (empty for unsupported sizes)
+    """
+    tables = _POSITION_TABLES.get(total_seats)
+    if tables is None:
+        return ()
+    return tables[dealer_seat % total_seats]
 
 
 def seats_in_position_order(
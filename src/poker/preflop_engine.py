@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 import logging
+import sys
 
 from .models import (
     Observation, PreflopDecision, Action, Position, HoleCards, Stage
@@ -37,6 +38,10 @@ from .preflop_ranges import (
 
 logger = logging.getLogger(__name__)
 
+# Memoized decisions per RangesBasedEngine, keyed on hand, situation,
+# positions and stack bucket (cleared when full)
+DECISION_CACHE_SIZE = 4096
+
 
 # -----------------------------------------------------------------------------
 # Position mapping
@@ -59,10 +64,18 @@ POSITION_TO_RANGE_KEY: Dict[str, str] = {
     "UNKNOWN": None,
 }
 
+# Same mapping keyed by the enum member itself (no .value lookup per call),
+# with interned keys so range dict probes short-circuit on identity
+_POSITION_KEYS: Dict[Position, Optional[str]] = {
+    position: sys.intern(POSITION_TO_RANGE_KEY[position.value])
+    if POSITION_TO_RANGE_KEY.get(position.value) else None
+    for position in Position
+}
+
 
 def position_to_key(position: Position) -> Optional[str]:
     """Convert Position enum to range lookup key."""
-    return POSITION_TO_RANGE_KEY.get(position.value)
+    return _POSITION_KEYS.get(position)
 
 
 # Preflop action order (first to act -> last to act)
@@ -71,12 +84,35 @@ ACTION_ORDER: List[str] = [
 ]
 
 
+_ACTION_INDEX: Dict[str, int] = {key: i for i, key in enumerate(ACTION_ORDER)}
+
+# Bit (1 << action index) per Position, aliases included; UNKNOWN has none
+_POSITION_ACTION_BITS: Dict[Position, int] = {
+    position: 1 << _ACTION_INDEX[key]
+    for position, key in _POSITION_KEYS.items()
+    if key is not None
+}
+
+
 def get_action_index(pos_key: str) -> int:
     """Get position index in action order (-1 if not found)."""
-    try:
-        return ACTION_ORDER.index(pos_key)
-    except ValueError:
-        return -1
+    return _ACTION_INDEX.get(pos_key, -1)
+
+
+def active_positions_mask(positions) -> int:
+    """
+    Pack positions into a bitmask, bit i set for ACTION_ORDER[i].
+    
+    Args:
+        positions: Iterable of Position enums (unknown ones are ignored)
+    
+    Returns:
+        Bitmask of active positions
+    """
+    mask = 0
+    for position in positions:
+        mask |= _POSITION_ACTION_BITS.get(position, 0)
+    return mask
 
 
 # -----------------------------------------------------------------------------
@@ -94,7 +130,7 @@ class ActionSituation(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ActionContext:
     """Context for making preflop decisions."""
     situation: ActionSituation
@@ -161,41 +197,90 @@ class RangesBasedEngine(PreflopEngine):
         """
         self.min_stack_for_ranges = min_stack_for_ranges
         self.rfi_only_mode = rfi_only_mode
+        
+        # Immutable decisions memoized by _decide_cached. A plain dict of
+        # values, so unlike lru_cache over a bound method it holds no
+        # reference back to the engine.
+        self._decision_cache: Dict[tuple, Optional[PreflopDecision]] = {}
     
     def get_decision(self, observation: Observation) -> Optional[PreflopDecision]:
         """Get preflop decision based on ranges."""
-        # Validate preflop stage
-        if observation.stage != Stage.PREFLOP:
+        # Cheap exits first - identity checks only, before any string work
+        if observation.stage is not Stage.PREFLOP:
             logger.debug("Not preflop, skipping")
             return None
         
-        # Validate hero cards
-        if observation.hero_cards is None:
+        hero_cards = observation.hero_cards
+        if hero_cards is None:
             logger.warning("No hero cards detected")
             return None
         
-        # Validate hero position
-        if observation.hero_position is None:
+        hero_position = observation.hero_position
+        if hero_position is None:
             logger.warning("No hero position detected")
             return None
         
-        hero_key = position_to_key(observation.hero_position)
+        hero_key = position_to_key(hero_position)
         if hero_key is None:
-            logger.warning(f"Unknown position: {observation.hero_position}")
+            logger.warning("Unknown position: %s", hero_position)
             return None
         
-        hand = observation.hero_cards.hand_notation()
+        hand = hero_cards.hand_notation()
         stack_bb = observation.hero_stack_bb or 100.0  # Default to deep stack
         
         # Determine action context
         context = self._analyze_context(observation, hero_key, stack_bb)
         
         logger.debug(
-            f"Hand: {hand}, Position: {hero_key}, "
-            f"Stack: {stack_bb}bb, Situation: {context.situation.value}"
+            "Hand: %s, Position: %s, Stack: %sbb, Situation: %s",
+            hand, hero_key, stack_bb, context.situation.value,
+        )
+        
+        return self._decide_cached(hand, context)
+    
+    def _decide_cached(self, hand: str, context: ActionContext) -> Optional[PreflopDecision]:
+        """
+        Memoized _decide for spots whose decision depends on the stack bucket only.
+        
+        Push/fold decisions carry the exact stack (all-in sizing, reasoning
+        text and the 10bb range split), so they bypass the cache - they
+        are a couple of dict lookups anyway.
+        
+        Args:
+            hand: Hand notation like 'AKs'
+            context: Analyzed action context
+        
+        Returns:
+            PreflopDecision or None when the situation is skipped
+        """
+        if context.situation is ActionSituation.PUSH_FOLD:
+            return self._decide(hand, context)
+        
+        key = (
+            hand, context.situation, context.hero_pos, context.villain_pos,
+            get_stack_bucket(context.stack_bb),
         )
+        cache = self._decision_cache
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        if len(cache) >= DECISION_CACHE_SIZE:
+            cache.clear()
+        decision = cache[key] = self._decide(hand, context)
+        return decision
+    
+    def _decide(self, hand: str, context: ActionContext) -> Optional[PreflopDecision]:
+        """
+        Route a hand to the handler for its situation.
         
-        # Route to appropriate handler
+        Args:
+            hand: Hand notation like 'AKs'
+            context: Analyzed action context
+        
+        Returns:
+            PreflopDecision or None when the situation is skipped
+        """
         if context.situation == ActionSituation.PUSH_FOLD:
             return self._handle_push_fold(hand, context)
         elif context.situation == ActionSituation.RFI:
@@ -233,25 +318,25 @@ class RangesBasedEngine(PreflopEngine):
                 stack_bb=stack_bb,
             )
         
-        # Determine if this is RFI or facing action
-        # For now, use simple heuristic based on active positions
-        is_rfi = self._is_rfi_situation(observation, hero_key)
-        
-        if is_rfi:
-            return ActionContext(
-                situation=ActionSituation.RFI,
-                hero_pos=hero_key,
-                villain_pos=None,
-                stack_bb=stack_bb,
-            )
-        
-        # Facing action - determine opener position
-        opener_pos = self._find_opener_position(observation, hero_key)
-        
-        if opener_pos:
-            # Check if we are the opener (facing 3bet)
-            # This would require tracking our previous action
-            # For now, assume we're facing an open
+        # Determine if this is RFI or facing action from the active players
+        # who act before hero (bits below hero's action index)
+        hero_idx = get_action_index(hero_key)
+        if hero_idx >= 0:
+            before_hero = active_positions_mask(observation.active_positions) & ((1 << hero_idx) - 1)
+            
+            # RFI = all players before hero have folded
+            if not before_hero:
+                return ActionContext(
+                    situation=ActionSituation.RFI,
+                    hero_pos=hero_key,
+                    villain_pos=None,
+                    stack_bb=stack_bb,
+                )
+            
+            # Facing action - the opener is the earliest active position
+            # (lowest set bit). Facing a 3bet would require tracking our
+            # previous action, so for now assume we're facing an open.
+            opener_pos = ACTION_ORDER[(before_hero & -before_hero).bit_length() - 1]
             return ActionContext(
                 situation=ActionSituation.FACING_OPEN,
                 hero_pos=hero_key,
@@ -266,52 +351,6 @@ class RangesBasedEngine(PreflopEngine):
             stack_bb=stack_bb,
         )
     
-    def _is_rfi_situation(self, observation: Observation, hero_key: str) -> bool:
-        """
-        Check if this is a Raise First In situation.
-        
-        RFI = all players before hero have folded.
-        """
-        hero_idx = get_action_index(hero_key)
-        if hero_idx < 0:
-            return False
-        
-        # Check active positions - if any active player is before hero, not RFI
-        if observation.active_positions:
-            for pos in observation.active_positions:
-                pos_key = position_to_key(pos)
-                if pos_key is None:
-                    continue
-                pos_idx = get_action_index(pos_key)
-                if pos_idx >= 0 and pos_idx < hero_idx:
-                    return False
-        
-        return True
-    
-    def _find_opener_position(
-        self,
-        observation: Observation,
-        hero_key: str
-    ) -> Optional[str]:
-        """Find the position of the opener (first raiser)."""
-        hero_idx = get_action_index(hero_key)
-        
-        # Look for earliest active position before hero
-        earliest_pos = None
-        earliest_idx = float('inf')
-        
-        if observation.active_positions:
-            for pos in observation.active_positions:
-                pos_key = position_to_key(pos)
-                if pos_key is None:
-                    continue
-                pos_idx = get_action_index(pos_key)
-                if 0 <= pos_idx < hero_idx and pos_idx < earliest_idx:
-                    earliest_idx = pos_idx
-                    earliest_pos = pos_key
-        
-        return earliest_pos
-    
     # -------------------------------------------------------------------------
     # Decision handlers
     # -------------------------------------------------------------------------
@@ -12,6 +12,7 @@ Hand notation:
 - Suited: "AKs", "T9s"
 - Offsuit: "AKo", "T9o"
 """
+import math
 from typing import Dict, Set, FrozenSet
 
 
@@ -1408,16 +1409,8 @@ ICM_PUSH_FOLD: Dict[str, Dict[str, Dict[str, HandSet]]] = {
 # Utility functions
 # -----------------------------------------------------------------------------
 
-def get_stack_bucket(stack_bb: float) -> str:
-    """
-    Get stack bucket for ICM push/fold lookup.
-    
-    Args:
-        stack_bb: Stack size in big blinds
-    
-    Returns:
-        Stack bucket string: "1-5bb", "6-10bb", "10-15bb", "16-20bb", or "deep"
-    """
+def _classify_stack_bucket(stack_bb: float) -> str:
+    """Bucket ladder for one stack size (used to build _STACK_BUCKETS)."""
     if stack_bb < 1:
         return "1-5bb"
     elif stack_bb <= 5:
@@ -1432,6 +1425,28 @@ def get_stack_bucket(stack_bb: float) -> str:
         return "deep"
 
 
+# Bucket for every whole-bb stack 0..20. Bucket edges are whole numbers, so
+# a fractional stack falls in the same bucket as its ceiling.
+_STACK_BUCKETS = tuple(_classify_stack_bucket(bb) for bb in range(21))
+
+
+def get_stack_bucket(stack_bb: float) -> str:
+    """
+    Get stack bucket for ICM push/fold lookup.
+    
+    Args:
+        stack_bb: Stack size in big blinds
+    
+    Returns:
+        Stack bucket string: "1-5bb", "6-10bb", "10-15bb", "16-20bb", or "deep"
+    """
+    if not stack_bb <= 20:  # Also catches NaN, like the ladder did
+        return "deep"
+    if stack_bb < 0:
+        return _STACK_BUCKETS[0]
+    return _STACK_BUCKETS[math.ceil(stack_bb)]
+
+
 def is_short_stack(stack_bb: float) -> bool:
     """Check if stack is in push/fold territory (<= 10bb)."""
     return stack_bb <= 10
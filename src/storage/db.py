@@ -2,24 +2,201 @@
 SQLite database helper.
 Provides simple interface for reading/writing poker data.
 """
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 import logging
 import sqlite3
 import threading
+import time
 
 from ..app.config import DATA_DIR
+from ..poker.models import _dumps
 
 
 logger = logging.getLogger(__name__)
 
-# Current schema version for future migrations
-SCHEMA_VERSION = 1
+# Current schema version, kept in PRAGMA user_version (see _init_schema)
+# 2: observations/events/decisions ts stored as INTEGER epoch microseconds
+SCHEMA_VERSION = 2
 
 # Path to schema file
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# Connection settings for the single-writer logging workload, applied to
+# every connection by default: WAL avoids an fsync per commit and lets
+# readers run alongside the writer, NORMAL sync stays crash-safe in WAL mode,
+# busy_timeout waits out a concurrent writer instead of raising "locked"
+WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+
+def to_epoch_us(timestamp: Union[datetime, int]) -> int:
+    """
+    Convert a timestamp to the INTEGER epoch microseconds stored in ts.
+    
+    Args:
+        timestamp: Union[datetime, int], or epoch microseconds passed through as-is
+    
+    Returns:
+        Microseconds since the Unix epoch
+    """
+    if isinstance(timestamp, int):
+        return timestamp
+    return int(timestamp.timestamp() * 1_000_000)
+
+
+def _ensure_json(value: Any) -> Optional[str]:
+    """
+    Serialize a *_json column value unless it already is a string.
+    
+    Args:
+        value: JSON string (stored as-is), None, or a list/dict to encode
+    
+    Returns:
+        JSON text, or None
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return _dumps(value)
+
+
+def _make_row_converter(columns: List[str]) -> Callable[[tuple], dict]:
+    """
+    Build a tuple -> dict converter for one table's column list.
+    
+    The column names are resolved once here, so converting a row needs
+    no per-row cursor.description walk or sqlite3.Row object.
+    
+    Args:
+        columns: Column names in SELECT * order
+    
+    Returns:
+        Function mapping a row tuple to a dict
+    """
+    columns = tuple(columns)
+    
+    def convert(row: tuple) -> dict:
+        return dict(zip(columns, row))
+    
+    return convert
+
+
+def _legacy_ts_to_epoch_us(value: Union[str, int, None]) -> Optional[int]:
+    """
+    Convert a schema v1 ts value (ISO string) to epoch microseconds.
+    
+    Digit strings are ints that a TEXT ts column coerced on insert and
+    pass through unchanged.
+    
+    Args:
+        value: Stored ts value
+    
+    Returns:
+        Epoch microseconds, or None if value is None
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if value.isdigit():
+        return int(value)
+    return to_epoch_us(datetime.fromisoformat(value))
+
+
+def now_epoch_us() -> int:
+    """Current time as epoch microseconds, without building a datetime."""
+    return time.time_ns() // 1000
+
+
+# Write statements as module constants - shared by the single-row and bulk
+# paths, so sqlite3's per-connection statement cache holds one prepared
+# statement for each
+_INSERT_SESSION_SQL = """
+    INSERT INTO sessions (app_version, notes)
+    VALUES (?, ?)
+"""
+
+_END_SESSION_SQL = """
+    UPDATE sessions SET ended_at = datetime('now')
+    WHERE id = ?
+"""
+
+_INSERT_WINDOW_SQL = """
+    INSERT INTO windows (session_id, window_id, title, hwnd)
+    VALUES (?, ?, ?, ?)
+"""
+
+_INSERT_OBSERVATION_SQL = """
+    INSERT INTO observations (
+        session_id, window_id, ts, stage, dealer_seat,
+        hero_position, active_players_count, active_positions_json,
+        hero_cards_json, board_cards_json, pot_bb, raw_confidence_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO events (session_id, window_id, ts, type, payload_json)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Events per multi-row INSERT ... VALUES statement: 5 params each keeps a
+# full chunk at 500 variables, inside SQLite's 999 limit on older builds
+EVENTS_PER_STATEMENT = 100
+
+
+@lru_cache(maxsize=EVENTS_PER_STATEMENT)
+def _insert_events_sql(count: int) -> str:
+    """INSERT INTO events with `count` value tuples (cached per count)."""
+    return (
+        "INSERT INTO events (session_id, window_id, ts, type, payload_json) VALUES "
+        + ", ".join(["(?, ?, ?, ?, ?)"] * count)
+    )
+
+
+_INSERT_DECISION_SQL = """
+    INSERT INTO decisions (
+        session_id, window_id, ts, stage, hero_position,
+        recommended_action, source, confidence
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Tables whose row counts get_stats reports
+STATS_TABLES = ("sessions", "windows", "observations", "events", "decisions")
+
+# Tables whose ts column changed from ISO TEXT (v1) to INTEGER epoch-us (v2)
+TS_MIGRATION_TABLES = ("observations", "events", "decisions")
+
+# Tables whose secondary indexes bulk_load drops and rebuilds
+BULK_LOAD_TABLES = ("observations", "events", "decisions")
+
+# Non-unique indexes on those tables, with the SQL that recreates them
+# (autoindexes for UNIQUE/PRIMARY KEY constraints have NULL sql)
+_BULK_LOAD_INDEXES_SQL = """
+    SELECT name, sql FROM sqlite_master
+    WHERE type = 'index' AND sql IS NOT NULL
+      AND tbl_name IN ({})
+""".format(", ".join("?" * len(BULK_LOAD_TABLES)))
+
+# Write transactions open with BEGIN IMMEDIATE: the write lock is taken up
+# front instead of upgrading a read lock mid-transaction, which can fail
+# with SQLITE_BUSY and skip busy_timeout. Readers are unaffected under WAL.
+WRITE_ISOLATION_LEVEL = "IMMEDIATE"
+
+# Tables read back with SELECT *, each with a row converter
+QUERY_TABLES = ("observations", "events", "decisions")
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
 
 class Database:
     """
@@ -27,18 +204,38 @@ class Database:
     Thread-safe with connection per thread.
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Union[Path, str]] = None,
+        write_pragmas: bool = True
+    ):
         """
         Initialize database.
         
         Args:
-            db_path: Path to SQLite file (creates default if not provided)
+            db_path: Path to SQLite file (creates default if not provided),
+                or a "file:" URI string such as
+                "file:name?mode=memory&cache=shared" for an in-memory
+                database shared by all of this object's connections
+            write_pragmas: Apply WRITE_PRAGMAS (WAL etc.) to every connection
         """
         self.db_path = db_path or (DATA_DIR / "plutos.db")
+        self._is_uri = isinstance(self.db_path, str) and self.db_path.startswith("file:")
         self._local = threading.local()
+        self._write_pragmas = write_pragmas
+        self._write_lock = threading.Lock()
+        # Row counts per table for get_stats: seeded by COUNT(*), kept
+        # current by this instance's inserts, and re-seeded when
+        # PRAGMA data_version shows a commit from any other connection
+        self._row_counts: Optional[Dict[str, int]] = None
+        self._counts_version: Optional[tuple] = None  # (connection, data_version)
+        # Per-table row -> dict converters, built from the schema's columns
+        self._row_converters: Dict[str, Callable[[tuple], dict]] = {}
         
         # Ensure data directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._is_uri:
+            self.db_path = Path(self.db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize schema
         self._init_schema()
@@ -48,11 +245,61 @@ class Database:
         if not hasattr(self._local, "conn") or self._local.conn is None:
             self._local.conn = sqlite3.connect(
                 str(self.db_path),
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=CACHED_STATEMENTS,
+                uri=self._is_uri,
+                isolation_level=WRITE_ISOLATION_LEVEL,
             )
             self._local.conn.row_factory = sqlite3.Row
+            if self._write_pragmas:
+                self._apply_write_pragmas(self._local.conn)
         return self._local.conn
     
+    @contextmanager
+    def _writer(
+        self,
+        table: Optional[str] = None,
+        rows: int = 1
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the calling thread's connection inside a write transaction.
+        
+        Writers from all threads queue on one in-process lock instead of
+        spinning in SQLite's busy handler; readers are not blocked (WAL).
+        Commits on exit, rolls back on error.
+        
+        Args:
+            table: Table the write inserts into, for the get_stats counts
+            rows: Number of rows inserted
+        """
+        conn = self._get_connection()
+        with self._write_lock:
+            with conn:
+                yield conn
+            # Committed - count the rows while still holding the write lock
+            if table is not None and self._row_counts is not None:
+                self._row_counts[table] += rows
+    
+    @staticmethod
+    def _apply_write_pragmas(conn: sqlite3.Connection):
+        """Apply WRITE_PRAGMAS to a connection."""
+        for pragma in WRITE_PRAGMAS:
+            conn.execute(pragma)
+    
+    def enable_write_pragmas(self):
+        """
+        Switch to WAL journaling with synchronous=NORMAL.
+        
+        Already the default; only needed for a Database opened with
+        write_pragmas=False. Applies to the calling thread's connection now
+        and to every thread-local connection opened afterwards.
+        """
+        self._write_pragmas = True
+        try:
+            self._apply_write_pragmas(self._get_connection())
+        except sqlite3.Error as e:
+            logger.error(f"Failed to apply write pragmas: {e}")
+    
     def _init_schema(self):
         """Initialize database schema."""
         if not SCHEMA_PATH.exists():
@@ -64,18 +311,100 @@ class Database:
         
         conn = self._get_connection()
         try:
-            conn.executescript(schema_sql)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            has_tables = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'observations'"
+            ).fetchone() is not None
+            if has_tables and version < SCHEMA_VERSION:
+                self._migrate_ts_to_epoch_us(conn, schema_sql)
+            else:
+                conn.executescript(schema_sql)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             conn.commit()
+            for table in QUERY_TABLES:
+                columns = [col[1] for col in conn.execute(f"PRAGMA table_info({table})")]
+                self._row_converters[table] = _make_row_converter(columns)
             logger.info(f"Database initialized: {self.db_path}")
         except sqlite3.Error as e:
             logger.error(f"Schema initialization error: {e}")
     
+    @staticmethod
+    def _migrate_ts_to_epoch_us(conn: sqlite3.Connection, schema_sql: str):
+        """
+        Upgrade a schema v1 database, whose ts columns hold ISO strings.
+        
+        CREATE TABLE IF NOT EXISTS never retypes a column, so each table
+        in TS_MIGRATION_TABLES is renamed aside, recreated from the schema
+        with ts INTEGER, and its rows copied over with ts converted. The
+        whole upgrade runs as one script in a single transaction.
+        
+        Args:
+            conn: Connection to the v1 database
+            schema_sql: Current schema script
+        """
+        conn.create_function("legacy_ts_to_epoch_us", 1, _legacy_ts_to_epoch_us)
+        steps = ["BEGIN"]
+        copies = []
+        for table in TS_MIGRATION_TABLES:
+            old = f"{table}_v1"
+            columns = [col[1] for col in conn.execute(f"PRAGMA table_info({table})")]
+            indexes = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND sql IS NOT NULL AND tbl_name = ?", (table,)
+            ).fetchall()
+            steps.append(f"ALTER TABLE {table} RENAME TO {old}")
+            # Renamed indexes would keep their names and block the schema's
+            # CREATE INDEX IF NOT EXISTS for the new table
+            steps.extend(f'DROP INDEX "{name}"' for name, in indexes)
+            select = ", ".join(
+                "legacy_ts_to_epoch_us(ts)" if col == "ts" else col for col in columns
+            )
+            copies.append(
+                f"INSERT INTO {table} ({', '.join(columns)}) SELECT {select} FROM {old}"
+            )
+            copies.append(f"DROP TABLE {old}")
+        steps.append(schema_sql)
+        steps.extend(copies)
+        steps.append(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        steps.append("COMMIT")
+        try:
+            conn.executescript(";\n".join(steps))
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        logger.info("Migrated ts columns to epoch microseconds (schema v%d)", SCHEMA_VERSION)
+    
     def close(self):
         """Close the database connection."""
         if hasattr(self._local, "conn") and self._local.conn:
             self._local.conn.close()
             self._local.conn = None
     
+    @contextmanager
+    def bulk_load(self) -> Iterator["Database"]:
+        """
+        Defer index maintenance for a large initial load.
+        
+        Drops the secondary indexes on BULK_LOAD_TABLES, yields for the
+        inserts, then recreates them - one index build after the load
+        instead of an index update per inserted row. Indexes are rebuilt
+        even if the load raises.
+        
+        Yields:
+            This database, for the insert calls
+        """
+        with self._writer() as conn:
+            indexes = conn.execute(_BULK_LOAD_INDEXES_SQL, BULK_LOAD_TABLES).fetchall()
+            for name, _ in indexes:
+                conn.execute(f'DROP INDEX "{name}"')
+        try:
+            yield self
+        finally:
+            with self._writer() as conn:
+                for _, sql in indexes:
+                    conn.execute(sql)
+            logger.info("Rebuilt %d indexes after bulk load", len(indexes))
+    
     # Session operations
     
     def create_session(
@@ -89,30 +418,16 @@ class Database:
         Returns:
             New session ID
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
-            """
-            INSERT INTO sessions (app_version, notes)
-            VALUES (?, ?)
-            """,
-            (app_version, notes)
-        )
-        conn.commit()
+        with self._writer("sessions") as conn:
+            cursor = conn.execute(_INSERT_SESSION_SQL, (app_version, notes))
         session_id = cursor.lastrowid
         logger.info(f"Created session {session_id}")
         return session_id
     
     def end_session(self, session_id: int):
         """Mark session as ended."""
-        conn = self._get_connection()
-        conn.execute(
-            """
-            UPDATE sessions SET ended_at = datetime('now')
-            WHERE id = ?
-            """,
-            (session_id,)
-        )
-        conn.commit()
+        with self._writer() as conn:
+            conn.execute(_END_SESSION_SQL, (session_id,))
     
     # Window operations
     
@@ -129,15 +444,11 @@ class Database:
         Returns:
             Window record ID
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
-            """
-            INSERT INTO windows (session_id, window_id, title, hwnd)
-            VALUES (?, ?, ?, ?)
-            """,
-            (session_id, window_id, title, hwnd)
-        )
-        conn.commit()
+        with self._writer("windows") as conn:
+            cursor = conn.execute(
+                _INSERT_WINDOW_SQL,
+                (session_id, window_id, title, hwnd)
+            )
         return cursor.lastrowid
     
     # Observation operations
@@ -146,50 +457,69 @@ class Database:
         self,
         session_id: Optional[int],
         window_id: str,
-        timestamp: datetime,
+        timestamp: Union[datetime, int],
         stage: str,
         dealer_seat: Optional[int],
         hero_position: Optional[str],
         active_players_count: Optional[int],
-        active_positions_json: Optional[str],
-        hero_cards_json: Optional[str],
-        board_cards_json: Optional[str],
+        active_positions_json: Optional[Union[str, list, dict]],
+        hero_cards_json: Optional[Union[str, list, dict]],
+        board_cards_json: Optional[Union[str, list, dict]],
         pot_bb: Optional[float],
-        raw_confidence_json: Optional[str]
+        raw_confidence_json: Optional[Union[str, list, dict]]
     ) -> int:
         """
         Insert an observation record.
         
+        The *_json arguments may be JSON strings, stored as-is, or
+        lists/dicts, serialized here.
+        
         Returns:
             Observation ID
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
-            """
-            INSERT INTO observations (
-                session_id, window_id, ts, stage, dealer_seat,
-                hero_position, active_players_count, active_positions_json,
-                hero_cards_json, board_cards_json, pot_bb, raw_confidence_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                session_id, window_id, timestamp.isoformat(), stage, dealer_seat,
-                hero_position, active_players_count, active_positions_json,
-                hero_cards_json, board_cards_json, pot_bb, raw_confidence_json
+        with self._writer("observations") as conn:
+            cursor = conn.execute(
+                _INSERT_OBSERVATION_SQL,
+                (
+                    session_id, window_id, to_epoch_us(timestamp), stage, dealer_seat,
+                    hero_position, active_players_count,
+                    _ensure_json(active_positions_json), _ensure_json(hero_cards_json),
+                    _ensure_json(board_cards_json), pot_bb,
+                    _ensure_json(raw_confidence_json)
+                )
             )
-        )
-        conn.commit()
         return cursor.lastrowid
     
+    def insert_observations_bulk(self, rows: List[tuple]) -> int:
+        """
+        Insert many observation records in one transaction.
+        
+        Args:
+            rows: Tuples in observations column order (session_id, window_id,
+                ts as epoch microseconds, stage, dealer_seat, hero_position,
+                active_players_count, active_positions_json, hero_cards_json,
+                board_cards_json, pot_bb, raw_confidence_json)
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        # One transaction for the whole batch; rolled back if any row fails
+        with self._writer("observations", len(rows)) as conn:
+            conn.executemany(_INSERT_OBSERVATION_SQL, rows)
+        return len(rows)
+    
     # Event operations
     
     def insert_event(
         self,
         session_id: Optional[int],
         window_id: str,
-        timestamp: datetime,
+        timestamp: Union[datetime, int],
         event_type: str,
-        payload_json: Optional[str]
+        payload_json: Optional[Union[str, list, dict]]
     ) -> int:
         """
         Insert an event record.
@@ -197,24 +527,47 @@ class Database:
         Returns:
             Event ID
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
-            """
-            INSERT INTO events (session_id, window_id, ts, type, payload_json)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (session_id, window_id, timestamp.isoformat(), event_type, payload_json)
-        )
-        conn.commit()
+        with self._writer("events") as conn:
+            cursor = conn.execute(
+                _INSERT_EVENT_SQL,
+                (
+                    session_id, window_id, to_epoch_us(timestamp), event_type,
+                    _ensure_json(payload_json)
+                )
+            )
         return cursor.lastrowid
     
+    def insert_events_bulk(self, rows: List[tuple]) -> int:
+        """
+        Insert many event records in one transaction.
+        
+        Rows go in as multi-row INSERT ... VALUES statements of up to
+        EVENTS_PER_STATEMENT rows, which binds a whole chunk per statement
+        step instead of one row.
+        
+        Args:
+            rows: Tuples in events column order (session_id, window_id,
+                ts as epoch microseconds, type, payload_json)
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        with self._writer("events", len(rows)) as conn:
+            for start in range(0, len(rows), EVENTS_PER_STATEMENT):
+                chunk = rows[start:start + EVENTS_PER_STATEMENT]
+                conn.execute(_insert_events_sql(len(chunk)), list(chain.from_iterable(chunk)))
+        return len(rows)
+    
     # Decision operations
     
     def insert_decision(
         self,
         session_id: Optional[int],
         window_id: str,
-        timestamp: datetime,
+        timestamp: Union[datetime, int],
         stage: str,
         hero_position: Optional[str],
         recommended_action: str,
@@ -227,102 +580,154 @@ class Database:
         Returns:
             Decision ID
         """
-        conn = self._get_connection()
-        cursor = conn.execute(
-            """
-            INSERT INTO decisions (
-                session_id, window_id, ts, stage, hero_position,
-                recommended_action, source, confidence
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                session_id, window_id, timestamp.isoformat(), stage,
-                hero_position, recommended_action, source, confidence
+        with self._writer("decisions") as conn:
+            cursor = conn.execute(
+                _INSERT_DECISION_SQL,
+                (
+                    session_id, window_id, to_epoch_us(timestamp), stage,
+                    hero_position, recommended_action, source, confidence
+                )
             )
-        )
-        conn.commit()
         return cursor.lastrowid
     
     # Query operations
     
+    def _query(self, table: str, sql: str, params: tuple, raw: bool) -> list:
+        """
+        Run a SELECT * on the calling thread's connection.
+        
+        Args:
+            table: Table selected from, for its row converter
+            sql: Query text
+            params: Query parameters
+            raw: Return plain tuples (no per-row conversion) instead of dicts
+        
+        Returns:
+            List of dicts keyed by column name, or of tuples when raw
+        """
+        cursor = self._get_connection().cursor()
+        convert = self._row_converters.get(table)
+        if raw or convert is not None:
+            cursor.row_factory = None
+            rows = cursor.execute(sql, params).fetchall()
+            return rows if raw else list(map(convert, rows))
+        return [dict(row) for row in cursor.execute(sql, params)]
+    
     def get_session_observations(
         self,
         session_id: int,
-        limit: int = 100
-    ) -> List[dict]:
-        """Get observations for a session."""
-        conn = self._get_connection()
-        cursor = conn.execute(
+        limit: int = 100,
+        raw: bool = False
+    ) -> list:
+        """
+        Get observations for a session, newest first.
+        
+        Args:
+            session_id: Session to read
+            limit: Maximum rows returned
+            raw: Return tuples in table column order instead of dicts
+        """
+        return self._query(
+            "observations",
             """
             SELECT * FROM observations
             WHERE session_id = ?
             ORDER BY ts DESC
             LIMIT ?
             """,
-            (session_id, limit)
+            (session_id, limit),
+            raw
         )
-        return [dict(row) for row in cursor.fetchall()]
     
     def get_session_events(
         self,
         session_id: int,
         event_type: Optional[str] = None,
-        limit: int = 100
-    ) -> List[dict]:
-        """Get events for a session."""
-        conn = self._get_connection()
+        limit: int = 100,
+        raw: bool = False
+    ) -> list:
+        """
+        Get events for a session, newest first.
         
+        Args:
+            session_id: Session to read
+            event_type: Only events of this type (all types if None)
+            limit: Maximum rows returned
+            raw: Return tuples in table column order instead of dicts
+        """
         if event_type:
-            cursor = conn.execute(
+            return self._query(
+                "events",
                 """
                 SELECT * FROM events
                 WHERE session_id = ? AND type = ?
                 ORDER BY ts DESC
                 LIMIT ?
                 """,
-                (session_id, event_type, limit)
+                (session_id, event_type, limit),
+                raw
             )
-        else:
-            cursor = conn.execute(
-                """
-                SELECT * FROM events
-                WHERE session_id = ?
-                ORDER BY ts DESC
-                LIMIT ?
-                """,
-                (session_id, limit)
-            )
-        
-        return [dict(row) for row in cursor.fetchall()]
+        return self._query(
+            "events",
+            """
+            SELECT * FROM events
+            WHERE session_id = ?
+            ORDER BY ts DESC
+            LIMIT ?
+            """,
+            (session_id, limit),
+            raw
+        )
     
     def get_session_decisions(
         self,
         session_id: int,
-        limit: int = 100
-    ) -> List[dict]:
-        """Get decisions for a session."""
-        conn = self._get_connection()
-        cursor = conn.execute(
+        limit: int = 100,
+        raw: bool = False
+    ) -> list:
+        """
+        Get decisions for a session, newest first.
+        
+        Args:
+            session_id: Session to read
+            limit: Maximum rows returned
+            raw: Return tuples in table column order instead of dicts
+        """
+        return self._query(
+            "decisions",
             """
             SELECT * FROM decisions
             WHERE session_id = ?
             ORDER BY ts DESC
             LIMIT ?
             """,
-            (session_id, limit)
+            (session_id, limit),
+            raw
         )
-        return [dict(row) for row in cursor.fetchall()]
     
     def get_stats(self) -> dict:
-        """Get database statistics."""
-        conn = self._get_connection()
+        """
+        Get database statistics.
         
-        stats = {}
-        for table in ["sessions", "windows", "observations", "events", "decisions"]:
-            cursor = conn.execute(f"SELECT COUNT(*) as count FROM {table}")
-            stats[table] = cursor.fetchone()["count"]
+        Row counts are read with COUNT(*) once, then maintained by the
+        insert methods, so repeated calls don't rescan the tables. They are
+        re-read whenever PRAGMA data_version on the calling connection
+        moved, i.e. another connection (another thread's, another
+        Database object's or another process's) committed since.
         
-        return stats
+        Returns:
+            Dict of table name -> row count
+        """
+        with self._write_lock:
+            conn = self._get_connection()
+            version = (conn, conn.execute("PRAGMA data_version").fetchone()[0])
+            if self._row_counts is None or version != self._counts_version:
+                self._row_counts = {
+                    table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    for table in STATS_TABLES
+                }
+                self._counts_version = version
+            return dict(self._row_counts)
 
 
 # Module-level singleton
@@ -26,7 +26,7 @@ CREATE TABLE IF NOT EXISTS observations (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     session_id INTEGER,
     window_id TEXT NOT NULL,
-    ts TEXT NOT NULL,
+    ts INTEGER NOT NULL,  -- epoch microseconds
     stage TEXT NOT NULL,
     dealer_seat INTEGER,
     hero_position TEXT,
@@ -44,7 +44,7 @@ CREATE TABLE IF NOT EXISTS events (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     session_id INTEGER,
     window_id TEXT NOT NULL,
-    ts TEXT NOT NULL,
+    ts INTEGER NOT NULL,  -- epoch microseconds
     type TEXT NOT NULL,
     payload_json TEXT,
     FOREIGN KEY (session_id) REFERENCES sessions(id)
@@ -55,7 +55,7 @@ CREATE TABLE IF NOT EXISTS decisions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     session_id INTEGER,
     window_id TEXT NOT NULL,
-    ts TEXT NOT NULL,
+    ts INTEGER NOT NULL,  -- epoch microseconds
     stage TEXT NOT NULL,
     hero_position TEXT,
     recommended_action TEXT NOT NULL,
@@ -65,9 +65,17 @@ CREATE TABLE IF NOT EXISTS decisions (
 );
 
 -- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_observations_session ON observations(session_id);
+-- Per-session reads filter on session_id (and type) and sort by ts, so the
+-- composite indexes serve them as a range scan with no sort step
+CREATE INDEX IF NOT EXISTS idx_observations_session_ts ON observations(session_id, ts);
 CREATE INDEX IF NOT EXISTS idx_observations_window ON observations(window_id);
 CREATE INDEX IF NOT EXISTS idx_observations_ts ON observations(ts);
-CREATE INDEX IF NOT EXISTS idx_events_session ON events(session_id);
+CREATE INDEX IF NOT EXISTS idx_events_session_ts ON events(session_id, ts);
+CREATE INDEX IF NOT EXISTS idx_events_session_type_ts ON events(session_id, type, ts);
 CREATE INDEX IF NOT EXISTS idx_events_type ON events(type);
-CREATE INDEX IF NOT EXISTS idx_decisions_session ON decisions(session_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_session_ts ON decisions(session_id, ts);
+
+-- Single-column session indexes superseded by the composites above
+DROP INDEX IF EXISTS idx_observations_session;
+DROP INDEX IF EXISTS idx_events_session;
+DROP INDEX IF EXISTS idx_decisions_session;
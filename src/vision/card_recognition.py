@@ -7,6 +7,7 @@ Handles card detection, validation, and deduplication.
 - Caching: Values are cached until new hand detected
 """
 from collections import Counter
+from functools import lru_cache
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple, TypeVar
@@ -48,6 +49,77 @@ class RecognitionResult:
 # Default number of OCR samples for voting
 DEFAULT_VOTE_SAMPLES = 9
 
+# Rank binarization cutoff. Folds the old "contrast x1.5, clip, truncate to
+# uint8, > 128" chain into one compare: floor(min(g * 1.5, 255)) > 128 <=> g >= 86
+RANK_BINARY_MIN_GRAY = 86
+
+# Minimum share of glyph-bright pixels for a rank crop to hold a card.
+# Empty board slots show dark felt, which binarizes to (almost) all zeros.
+CARD_PRESENT_MIN_FRACTION = 0.05
+
+
+def binarize_rank(gray: np.ndarray) -> np.ndarray:
+    """
+    Binarize a grayscale rank image for OCR in a single pass.
+    
+    Args:
+        gray: uint8 grayscale array
+    
+    Returns:
+        uint8 array with 255 for glyph-bright pixels, 0 elsewhere
+    """
+    return np.where(gray >= RANK_BINARY_MIN_GRAY, np.uint8(255), np.uint8(0))
+
+
+# All 52 treys-format card strings ("2s" .. "Ac") for one-lookup validation
+VALID_CARD_STRINGS = frozenset(r + s for r in "23456789TJQKA" for s in "shdc")
+
+# Suit codes indexed by _suit_class_index
+SUIT_CODES = np.array(['h', 'c', 'd', 's'])
+
+
+def _suit_class_index(pixels: np.ndarray) -> np.ndarray:
+    """Class index into SUIT_CODES for every RGB pixel of a (..., 3) array."""
+    px = np.asarray(pixels, dtype=np.int16)
+    r, g, b = px[..., 0], px[..., 1], px[..., 2]
+    
+    # Same thresholds, in the same order, as recognize_suit_by_color
+    return np.select(
+        [
+            (r > 150) & (r > g) & (r > b),  # Hearts - red
+            (g > 100) & (g > r) & (g > b),  # Clubs - green
+            (b > 80) & (b > r),             # Diamonds - blue
+        ],
+        [0, 1, 2],
+        default=3                           # Spades - dark
+    )
+
+
+def classify_suits(pixels: np.ndarray) -> np.ndarray:
+    """
+    Vectorized CardRecognizer.recognize_suit_by_color.
+    
+    Args:
+        pixels: Array of shape (..., 3) with RGB values
+    
+    Returns:
+        Array of suit codes ('h', 'c', 'd', 's') of shape pixels.shape[:-1]
+    """
+    return SUIT_CODES[_suit_class_index(pixels)]
+
+
+def has_rank_glyph(binary: np.ndarray) -> bool:
+    """
+    Cheap card-present check on a binarized rank crop.
+    
+    Args:
+        binary: uint8 array from binarize_rank
+    
+    Returns:
+        True if enough pixels are bright to be worth an OCR call
+    """
+    return np.count_nonzero(binary) >= CARD_PRESENT_MIN_FRACTION * binary.size
+
 
 T = TypeVar('T')
 
@@ -79,6 +151,35 @@ def vote_for_result(samples: List[T]) -> Optional[T]:
     return most_common
 
 
+def collect_votes(sample: Callable[[], Optional[T]], num_samples: int) -> List[Optional[T]]:
+    """
+    Take up to num_samples readings, stopping once one value has a majority.
+    
+    Once a value holds num_samples // 2 + 1 votes no remaining sample can
+    change the vote_for_result outcome, so the rest are skipped.
+    
+    Args:
+        sample: Callable returning one reading (None if failed)
+        num_samples: Maximum number of readings
+    
+    Returns:
+        List of readings taken
+    """
+    majority = num_samples // 2 + 1
+    samples = []
+    counts: Dict[T, int] = {}
+    
+    for _ in range(num_samples):
+        value = sample()
+        samples.append(value)
+        if value is not None:
+            counts[value] = counts.get(value, 0) + 1
+            if counts[value] >= majority:
+                break
+    
+    return samples
+
+
 @dataclass
 class OCRCache:
     """
@@ -159,6 +260,20 @@ class CardRecognizer:
         if not TESSERACT_AVAILABLE:
             logger.warning("pytesseract not available, OCR disabled")
     
+    def warm_up(self) -> None:
+        """
+        Run one throwaway OCR on a blank rank image.
+        
+        The first Tesseract call pays process start-up and traineddata
+        loading; doing it here keeps that stall out of the first poll.
+        """
+        if not TESSERACT_AVAILABLE:
+            return
+        
+        start = time.perf_counter()
+        self._ocr_rank_binary(np.zeros((32, 24), dtype=np.uint8))
+        logger.debug("OCR warm-up took %.0fms", (time.perf_counter() - start) * 1000)
+    
     def recognize_rank_ocr(self, image: Image.Image) -> Tuple[Optional[str], float]:
         """
         Recognize card rank using Tesseract OCR.
@@ -172,18 +287,27 @@ class CardRecognizer:
         if not TESSERACT_AVAILABLE:
             return None, 0.0
         
+        # Preprocess image for better OCR
+        # Grayscale, contrast boost and threshold fused into one compare
+        try:
+            img_array = binarize_rank(np.asarray(image.convert('L')))
+        except Exception as e:
+            logger.debug(f"OCR preprocessing error: {e}")
+            return None, 0.0
+        
+        return self._ocr_rank_binary(img_array)
+    
+    def _ocr_rank_binary(self, img_array: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        OCR a binarized rank image.
+        
+        Args:
+            img_array: uint8 array from binarize_rank
+        
+        Returns:
+            (rank, confidence) or (None, 0.0)
+        """
         try:
-            # Preprocess image for better OCR
-            img = image.convert('L')  # Grayscale
-            img_array = np.array(img)
-            
-            # Increase contrast
-            img_array = np.clip(img_array * 1.5, 0, 255).astype(np.uint8)
-            
-            # Threshold to binary
-            threshold = 128
-            img_array = np.where(img_array > threshold, 255, 0).astype(np.uint8)
-            
             img_processed = Image.fromarray(img_array)
             
             # OCR with single character mode
@@ -191,7 +315,7 @@ class CardRecognizer:
             text = pytesseract.image_to_string(img_processed, config=ocr_config)
             text = text.strip().upper()
             
-            logger.debug(f"OCR raw text: '{text}' (img size: {image.size})")
+            logger.debug(f"OCR raw text: '{text}' (img size: {img_processed.size})")
             
             if not text:
                 logger.debug("OCR returned empty text")
@@ -231,11 +355,7 @@ class CardRecognizer:
         Returns:
             (rank, confidence) or (None, 0.0)
         """
-        samples = []
-        
-        for i in range(num_samples):
-            rank, _ = self.recognize_rank_ocr(image)
-            samples.append(rank)
+        samples = collect_votes(lambda: self.recognize_rank_ocr(image)[0], num_samples)
         
         result = vote_for_result(samples)
         
@@ -302,7 +422,71 @@ class CardRecognizer:
         """
         rank, rank_conf = self.recognize_rank_ocr(rank_image)
         suit, suit_conf = self.recognize_suit_by_color(suit_rgb)
+        return self._build_result(rank, rank_conf, suit, suit_conf)
+    
+    def recognize_batch(
+        self,
+        rank_images: List[Image.Image],
+        suit_rgbs: List[Tuple[int, int, int]]
+    ) -> List[RecognitionResult]:
+        """
+        Recognize several cards (e.g. board slots) in order.
+        
+        Rank crops sharing a shape are grayscaled and binarized as one
+        stacked array, and all suit colors are classified in one pass.
+        Recognition stops at the first invalid card, since later slots are
+        empty when an earlier one is. A slot with no bright glyph pixels
+        counts as empty without calling OCR.
+        
+        Args:
+            rank_images: PIL Images of the ranks
+            suit_rgbs: RGB tuples from the suit pixels
         
+        Returns:
+            RecognitionResults up to and including the first invalid one
+        """
+        grays = [np.asarray(img.convert('L')) for img in rank_images]
+        
+        if grays and all(g.shape == grays[0].shape for g in grays):
+            binaries = list(binarize_rank(np.stack(grays)))
+        else:
+            binaries = [binarize_rank(g) for g in grays]
+        
+        suits = classify_suits(suit_rgbs) if suit_rgbs else []
+        
+        results = []
+        for binary, suit in zip(binaries, suits):
+            if not has_rank_glyph(binary):
+                results.append(RecognitionResult(
+                    card=None,
+                    confidence=0.0,
+                    raw_rank="",
+                    raw_suit=str(suit),
+                    is_valid=False,
+                    error="No card in slot"
+                ))
+                break
+            
+            if TESSERACT_AVAILABLE:
+                rank, rank_conf = self._ocr_rank_binary(binary)
+            else:
+                rank, rank_conf = None, 0.0
+            
+            result = self._build_result(rank, rank_conf, str(suit), 1.0)
+            results.append(result)
+            if not result.is_valid:
+                break
+        
+        return results
+    
+    def _build_result(
+        self,
+        rank: Optional[str],
+        rank_conf: float,
+        suit: str,
+        suit_conf: float
+    ) -> RecognitionResult:
+        """Combine rank and suit readings into a RecognitionResult."""
         confidence = min(rank_conf, suit_conf)
         
         if rank is None:
@@ -335,7 +519,19 @@ class CardRecognizer:
                 error=str(e)
             )
     
+    # UI suit names/symbols -> suit letter
+    UI_SUIT_MAP = {
+        "spade": "s", "heart": "h", "diamond": "d", "club": "c",
+        "spades": "s", "hearts": "h", "diamonds": "d", "clubs": "c",
+        # Unicode symbols
+        "♠": "s", "♤": "s",  # Spade
+        "♥": "h", "♡": "h",  # Heart
+        "♦": "d", "♢": "d",  # Diamond
+        "♣": "c", "♧": "c",  # Club
+    }
+    
     @staticmethod
+    @lru_cache(maxsize=256)
     def convert_ui_card(ui_string: str) -> Optional[Card]:
         """
         Convert UI format card string to Card object.
@@ -350,18 +546,8 @@ class CardRecognizer:
             ui_string: Card string from UI
         
         Returns:
-            Card or None if invalid
+            Card or None if invalid (results are cached - Cards are immutable)
         """
-        SUIT_MAP = {
-            "spade": "s", "heart": "h", "diamond": "d", "club": "c",
-            "spades": "s", "hearts": "h", "diamonds": "d", "clubs": "c",
-            # Unicode symbols
-            "♠": "s", "♤": "s",  # Spade
-            "♥": "h", "♡": "h",  # Heart
-            "♦": "d", "♢": "d",  # Diamond
-            "♣": "c", "♧": "c",  # Club
-        }
-        
         ui_string = ui_string.strip()
         if not ui_string or len(ui_string) < 2:
             return None
@@ -376,7 +562,7 @@ class CardRecognizer:
         
         # Map suit
         suit_part = suit_part.strip().lower()
-        suit = SUIT_MAP.get(suit_part, suit_part)
+        suit = CardRecognizer.UI_SUIT_MAP.get(suit_part, suit_part)
         
         # Validate
         if rank not in Card.VALID_RANKS:
@@ -400,9 +586,7 @@ class CardRecognizer:
         Returns:
             True if valid
         """
-        if len(card_str) != 2:
-            return False
-        return card_str[0] in Card.VALID_RANKS and card_str[1] in Card.VALID_SUITS
+        return card_str in VALID_CARD_STRINGS
 
 
 def recognize_stack_ocr(
@@ -477,14 +661,12 @@ def recognize_stack_ocr_voted(
     Returns:
         Stack in BB as float, or None if recognition failed
     """
-    samples = []
-    
-    for _ in range(num_samples):
+    def sample() -> Optional[float]:
         value = recognize_stack_ocr(image, config)
         # Round to 2 decimal places for consistent voting
-        if value is not None:
-            value = round(value, 2)
-        samples.append(value)
+        return round(value, 2) if value is not None else None
+    
+    samples = collect_votes(sample, num_samples)
     
     result = vote_for_result(samples)
     
@@ -570,14 +752,12 @@ def recognize_pot_ocr_voted(
     Returns:
         Pot in BB as float, or None if recognition failed
     """
-    samples = []
-    
-    for _ in range(num_samples):
+    def sample() -> Optional[float]:
         value = recognize_pot_ocr(image, config)
         # Round to 2 decimal places for consistent voting
-        if value is not None:
-            value = round(value, 2)
-        samples.append(value)
+        return round(value, 2) if value is not None else None
+    
+    samples = collect_votes(sample, num_samples)
     
     result = vote_for_result(samples)
     
@@ -613,12 +793,11 @@ def convert_cards_list(
             errors.append(f"Invalid card: {s}")
             continue
         
-        card_key = str(card)
-        if deduplicate and card_key in seen:
-            errors.append(f"Duplicate card: {card_key}")
+        if deduplicate and card in seen:
+            errors.append(f"Duplicate card: {card}")
             continue
         
-        seen.add(card_key)
+        seen.add(card)
         cards.append(card)
     
     return cards, errors
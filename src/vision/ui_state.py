@@ -7,6 +7,9 @@ from typing import List, Optional, Tuple
 import logging
 
 import re
+
+import numpy as np
+
 try:
     import pytesseract
     from PIL import Image
@@ -16,13 +19,34 @@ try:
 except ImportError:
     HAS_OCR = False
 
+# Optional in-process Tesseract binding: takes raw pixel buffers directly,
+# skipping pytesseract's image encode, temp file and subprocess per call
+try:
+    import tesserocr
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
 from ..app.config import PixelCoord, PixelCheck, TableConfig, Region
-from ..capture.screen_capture import ScreenCapture, capture_pixel
+from ..capture.screen_capture import ScreenCapture, capture_pixel, crop_region, frame_pixel
 
 
 logger = logging.getLogger(__name__)
 
 
+# Dealer button is gray: every channel in [DEALER_GRAY_MIN, DEALER_GRAY_MAX]
+# and adjacent channels less than DEALER_GRAY_MAX_SPREAD apart
+DEALER_GRAY_MIN = 50
+DEALER_GRAY_MAX = 75
+DEALER_GRAY_MAX_SPREAD = 15
+
+# Card back is white/light (~240 RGB): every channel above ACTIVE_MIN_CHANNEL
+ACTIVE_MIN_CHANNEL = 200
+
+# Turn indicator is green: G channel above TURN_G_MIN and brighter than R
+TURN_G_MIN = 150
+
+
 @dataclass
 class DealerDetectionResult:
     """Result of dealer position detection."""
@@ -84,20 +108,51 @@ class UIStateDetector:
         self.config = config
         self._capture = capture or ScreenCapture()
         self._last_hand_id: Optional[str] = None
+        self._tess = None  # tesserocr API, created on first OCR call
+        self._build_probe_layout()
+    
+    def _build_probe_layout(self):
+        """
+        Stack every dealer/active/turn probe coordinate into one index set.
+        
+        get_full_state then grabs the bounding box of all probes once and
+        reads every pixel with a single fancy-indexing operation.
+        """
+        config = self.config
+        
+        # active_player_pixels excludes hero seat - map list index to seat index
+        check_seats = [s for s in range(8) if s != config.hero_seat_index]
+        active_pixels = list(config.active_player_pixels[:len(check_seats)])
+        
+        probes = list(config.dealer_pixels) + active_pixels + [config.turn_indicator_pixel]
+        xs = [p.left for p in probes]
+        ys = [p.top for p in probes]
+        left, top = min(xs), min(ys)
+        
+        self._probe_bbox = Region(left, top, max(xs) - left + 1, max(ys) - top + 1)
+        self._all_xs = np.array(xs, dtype=np.intp) - left
+        self._all_ys = np.array(ys, dtype=np.intp) - top
+        
+        n_dealer = len(config.dealer_pixels)
+        n_active = len(active_pixels)
+        self._dealer_slice = slice(0, n_dealer)
+        self._active_slice = slice(n_dealer, n_dealer + n_active)
+        self._turn_idx = n_dealer + n_active
+        self._active_seat_ids = check_seats[:n_active]
     
     def detect_dealer(
         self,
         window_offset: Tuple[int, int],
-        r_min: int = 50,
-        r_max: int = 75
+        r_min: int = DEALER_GRAY_MIN,
+        r_max: int = DEALER_GRAY_MAX
     ) -> DealerDetectionResult:
         """
         Find the dealer button by checking pixel colors.
         
         Args:
             window_offset: (x, y) screen offset of window client area
-            r_min: Minimum red channel value for dealer detection
-            r_max: Maximum red channel value for dealer detection
+            r_min: Minimum value of every channel for dealer detection
+            r_max: Maximum value of every channel for dealer detection
         
         Returns:
             DealerDetectionResult with seat index or None
@@ -115,11 +170,12 @@ class UIStateDetector:
             r, g, b = color
             debug_colors.append(f"S{seat_idx}:({r},{g},{b})")
             
-            # Dealer button is gray: R,G,B all in range 50-75 and similar to each other
+            # Dealer button is gray: R,G,B all in range and similar to each other
             is_gray = (r_min <= r <= r_max and 
                        r_min <= g <= r_max and 
                        r_min <= b <= r_max and
-                       abs(r - g) < 15 and abs(g - b) < 15)
+                       abs(r - g) < DEALER_GRAY_MAX_SPREAD and
+                       abs(g - b) < DEALER_GRAY_MAX_SPREAD)
             
             if is_gray:
                 return DealerDetectionResult(
@@ -176,9 +232,9 @@ class UIStateDetector:
             # Debug logging disabled
             # logger.debug(f"Seat {seat_idx}: RGB({r},{g},{b})")
             
-            # Card back is white/light (~240 RGB). Check if all channels > 200
+            # Card back is white/light (~240 RGB). Check all channels > ACTIVE_MIN_CHANNEL
             # When folded, pixel shows green table or colored avatar
-            if r > 200 and g > 200 and b > 200:
+            if r > ACTIVE_MIN_CHANNEL and g > ACTIVE_MIN_CHANNEL and b > ACTIVE_MIN_CHANNEL:
                 active_seats.append(seat_idx)
                 seat_colors[seat_idx] = color
         
@@ -190,21 +246,26 @@ class UIStateDetector:
     
     def detect_hero_turn(
         self,
-        window_offset: Tuple[int, int]
+        window_offset: Tuple[int, int],
+        frame: Optional[np.ndarray] = None
     ) -> TurnDetectionResult:
         """
         Detect if it's hero's turn to act.
         
         Args:
             window_offset: (x, y) screen offset of window client area
+            frame: Full-window RGB frame to read from (captures if None)
         
         Returns:
             TurnDetectionResult indicating if hero should act
         """
         pixel = self.config.turn_indicator_pixel
-        color = self._capture.capture_pixel(
-            pixel.left, pixel.top, window_offset
-        )
+        if frame is not None:
+            color = frame_pixel(frame, pixel.left, pixel.top)
+        else:
+            color = self._capture.capture_pixel(
+                pixel.left, pixel.top, window_offset
+            )
         
         if color is None:
             return TurnDetectionResult(
@@ -214,8 +275,8 @@ class UIStateDetector:
             )
         
         r, g, b = color
-        # Turn indicator is green - check G channel > 150 and G > R
-        is_turn = g > 150 and g > r
+        # Turn indicator is green - check G channel > TURN_G_MIN and G > R
+        is_turn = g > TURN_G_MIN and g > r
         confidence = 1.0 if is_turn else 0.0
         
         return TurnDetectionResult(
@@ -224,9 +285,53 @@ class UIStateDetector:
             confidence=confidence
         )
     
+    def _grab(
+        self,
+        region: Region,
+        window_offset: Tuple[int, int],
+        frame: Optional[np.ndarray]
+    ) -> Optional[np.ndarray]:
+        """Cut region from a full-window frame, or capture it if no frame."""
+        if frame is not None:
+            return crop_region(frame, region)
+        return self._capture.capture_region_array(region, window_offset)
+    
+    def close(self):
+        """Release the tesserocr API, if one was created."""
+        if self._tess is not None:
+            self._tess.End()
+            self._tess = None
+    
+    def _ocr_line(self, arr: np.ndarray, whitelist: str) -> str:
+        """
+        OCR a single line of text from an RGB array.
+        
+        Args:
+            arr: RGB uint8 array (H, W, 3)
+            whitelist: Allowed characters
+        
+        Returns:
+            Recognized text
+        """
+        if HAS_TESSEROCR:
+            if self._tess is None:
+                self._tess = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_LINE)
+            arr = np.ascontiguousarray(arr)
+            self._tess.SetVariable("tessedit_char_whitelist", whitelist)
+            self._tess.SetImageBytes(
+                arr.tobytes(), arr.shape[1], arr.shape[0], arr.shape[2], arr.strides[0]
+            )
+            return self._tess.GetUTF8Text()
+        
+        return pytesseract.image_to_string(
+            arr,
+            config=f'--psm 7 -c tessedit_char_whitelist={whitelist}'
+        )
+    
     def detect_hand_id(
         self,
-        window_offset: Tuple[int, int]
+        window_offset: Tuple[int, int],
+        frame: Optional[np.ndarray] = None
     ) -> HandIdResult:
         """
         Detect hand ID from screen using OCR.
@@ -234,22 +339,23 @@ class UIStateDetector:
         
         Args:
             window_offset: (x, y) screen offset of window client area
+            frame: Full-window RGB frame to crop from (captures if None)
             
         Returns:
             HandIdResult with current hand ID and new hand flag
         """
-        if not HAS_OCR:
+        if not (HAS_OCR or HAS_TESSEROCR):
             return HandIdResult(hand_id=None, is_new_hand=False, previous_id=self._last_hand_id)
         
         region = self.config.hand_id_region
-        img = self._capture.capture_region(region, window_offset)
+        arr = self._grab(region, window_offset, frame)
         
-        if img is None:
+        if arr is None:
             return HandIdResult(hand_id=None, is_new_hand=False, previous_id=self._last_hand_id)
         
         # OCR the region
         try:
-            text = pytesseract.image_to_string(img, config='--psm 7 -c tessedit_char_whitelist=0123456789')
+            text = self._ocr_line(arr, '0123456789')
             # Extract digits only
             digits = re.sub(r'\D', '', text)
             hand_id = digits if digits else None
@@ -269,7 +375,8 @@ class UIStateDetector:
     
     def detect_hero_stack(
         self,
-        window_offset: Tuple[int, int]
+        window_offset: Tuple[int, int],
+        frame: Optional[np.ndarray] = None
     ) -> HeroStackResult:
         """
         Detect hero's stack size using OCR.
@@ -277,26 +384,24 @@ class UIStateDetector:
         
         Args:
             window_offset: (x, y) screen offset of window client area
+            frame: Full-window RGB frame to crop from (captures if None)
             
         Returns:
             HeroStackResult with stack in BB
         """
-        if not HAS_OCR:
+        if not (HAS_OCR or HAS_TESSEROCR):
             return HeroStackResult(stack_bb=None, raw_text=None, confidence=0.0)
         
         region = self.config.hero_stack_region
-        img = self._capture.capture_region(region, window_offset)
+        arr = self._grab(region, window_offset, frame)
         
-        if img is None:
+        if arr is None:
             return HeroStackResult(stack_bb=None, raw_text=None, confidence=0.0)
         
         # OCR the region
         try:
             # Allow digits, comma, period, space, B
-            text = pytesseract.image_to_string(
-                img, 
-                config='--psm 7 -c tessedit_char_whitelist=0123456789,. BB'
-            ).strip()
+            text = self._ocr_line(arr, '0123456789,. BB').strip()
             
             if not text:
                 return HeroStackResult(stack_bb=None, raw_text=None, confidence=0.0)
@@ -325,21 +430,88 @@ class UIStateDetector:
     
     def get_full_state(
         self,
-        window_offset: Tuple[int, int]
+        window_offset: Tuple[int, int],
+        frame: Optional[np.ndarray] = None
     ) -> dict:
         """
         Get complete UI state in one call.
         
         Args:
             window_offset: (x, y) screen offset of window client area
+            frame: Full-window RGB frame to crop from (captures if None)
+        
+        Returns:
+            Dict with dealer, active_players, and hero_turn results
+        """
+        probe_frame = self._grab(self._probe_bbox, window_offset, frame)
+        
+        if probe_frame is None:
+            return {
+                "dealer": DealerDetectionResult(seat_index=None, pixel_color=None, confidence=0.0),
+                "active_players": ActivePlayersResult(active_seats=[], seat_colors={}, count=0),
+                "hero_turn": TurnDetectionResult(is_hero_turn=False, pixel_color=None, confidence=0.0),
+            }
+        
+        return self._detect_all_from_frame(probe_frame)
+    
+    def _detect_all_from_frame(self, frame: np.ndarray) -> dict:
+        """
+        Run dealer, active players and turn detection in one pass.
+        
+        Args:
+            frame: RGB array covering self._probe_bbox
         
         Returns:
             Dict with dealer, active_players, and hero_turn results
         """
+        # One gather for every probe; int16 so channel differences can't wrap
+        pix = frame[self._all_ys, self._all_xs].astype(np.int16)
+        
+        # Dealer button is gray: R,G,B all in range and similar to each other
+        dealer_pix = pix[self._dealer_slice]
+        r, g, b = dealer_pix[:, 0], dealer_pix[:, 1], dealer_pix[:, 2]
+        is_gray = (
+            ((dealer_pix >= DEALER_GRAY_MIN) & (dealer_pix <= DEALER_GRAY_MAX)).all(axis=1)
+            & (np.abs(r - g) < DEALER_GRAY_MAX_SPREAD)
+            & (np.abs(g - b) < DEALER_GRAY_MAX_SPREAD)
+        )
+        gray_seats = np.flatnonzero(is_gray)
+        if gray_seats.size:
+            seat_idx = int(gray_seats[0])
+            dealer = DealerDetectionResult(
+                seat_index=seat_idx,
+                pixel_color=tuple(int(c) for c in dealer_pix[seat_idx]),
+                confidence=1.0
+            )
+        else:
+            dealer = DealerDetectionResult(seat_index=None, pixel_color=None, confidence=0.0)
+        
+        # Card back is white/light (~240 RGB) - darkest channel > ACTIVE_MIN_CHANNEL
+        active_pix = pix[self._active_slice]
+        active_mask = active_pix.min(axis=1) > ACTIVE_MIN_CHANNEL
+        active_seats = []
+        seat_colors = {}
+        for list_idx in np.flatnonzero(active_mask):
+            seat_idx = self._active_seat_ids[list_idx]
+            active_seats.append(seat_idx)
+            seat_colors[seat_idx] = tuple(int(c) for c in active_pix[list_idx])
+        
+        # Turn indicator is green - check G channel > TURN_G_MIN and G > R
+        turn_color = pix[self._turn_idx]
+        is_turn = bool(turn_color[1] > TURN_G_MIN and turn_color[1] > turn_color[0])
+        
         return {
-            "dealer": self.detect_dealer(window_offset),
-            "active_players": self.detect_active_players(window_offset),
-            "hero_turn": self.detect_hero_turn(window_offset),
+            "dealer": dealer,
+            "active_players": ActivePlayersResult(
+                active_seats=active_seats,
+                seat_colors=seat_colors,
+                count=len(active_seats)
+            ),
+            "hero_turn": TurnDetectionResult(
+                is_hero_turn=is_turn,
+                pixel_color=tuple(int(c) for c in turn_color),
+                confidence=1.0 if is_turn else 0.0
+            ),
         }
 
 
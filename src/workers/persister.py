@@ -2,18 +2,26 @@
 Database persistence worker.
 Handles async writes of observations, events, and decisions to SQLite.
 """
-from datetime import datetime
 from typing import Optional
 import logging
+import operator
 import queue
 import threading
 
 from ..poker.models import Observation, PreflopDecision, HeroTurnEvent
-from ..storage.db import Database
+from ..storage.db import Database, now_epoch_us, to_epoch_us
 
 
 logger = logging.getLogger(__name__)
 
+# Max items drained from the queue per worker iteration
+BATCH_MAX_ITEMS = 128
+
+# Observation attributes stored as-is, in observations column order
+_OBS_COLS = operator.attrgetter(
+    "window_id", "timestamp", "dealer_seat", "active_players_count", "pot_bb"
+)
+
 
 class PersistenceWorker:
     """
@@ -36,57 +44,67 @@ class PersistenceWorker:
         self._running = False
         self._thread: Optional[threading.Thread] = None
     
-    def _process_item(self, item: dict):
+    def _process_item(self, item: dict, batch_ts: Optional[int] = None):
         """
         Process a single queue item.
         
         Args:
             item: Dict with 'type' and 'data' keys
+            batch_ts: Epoch microseconds shared by the current batch (for decisions)
         """
         item_type = item.get("type")
         data = item.get("data")
         
         try:
-            if item_type == "observation":
-                self._save_observation(data)
-            elif item_type == "event":
-                self._save_event(data)
-            elif item_type == "decision":
-                self._save_decision(data)
+            if item_type == "decision":
+                self._save_decision(data, ts=batch_ts)
             else:
                 logger.warning(f"Unknown item type: {item_type}")
         except Exception as e:
             logger.error(f"Error persisting {item_type}: {e}")
     
-    def _save_observation(self, observation: Observation):
-        """Save observation to database."""
-        self.db.insert_observation(
-            session_id=self.session_id,
-            window_id=observation.window_id,
-            timestamp=observation.timestamp,
-            stage=observation.stage.value,
-            dealer_seat=observation.dealer_seat,
-            hero_position=observation.hero_position.value,
-            active_players_count=observation.active_players_count,
-            active_positions_json=str([p.value for p in observation.active_positions]),
-            hero_cards_json=str(observation.hero_cards) if observation.hero_cards else None,
-            board_cards_json=str(observation.board_cards.to_list()),
-            pot_bb=observation.pot_bb,
-            raw_confidence_json=str(observation.confidence) if observation.confidence else None
+    def _observation_row(self, observation: Observation) -> tuple:
+        """Build an observations insert tuple for insert_observations_bulk."""
+        fields = observation.to_db_json()
+        window_id, timestamp, dealer_seat, active_count, pot_bb = _OBS_COLS(observation)
+        return (
+            self.session_id, window_id, to_epoch_us(timestamp), fields["stage"],
+            dealer_seat, fields["hero_position"], active_count,
+            fields["active_positions_json"], fields["hero_cards_json"],
+            fields["board_cards_json"], pot_bb, fields["raw_confidence_json"]
         )
     
-    def _save_event(self, event: HeroTurnEvent):
-        """Save event to database."""
-        self.db.insert_event(
-            session_id=self.session_id,
-            window_id=event.window_id,
-            timestamp=event.timestamp,
-            event_type="HERO_TURN",
-            payload_json=event.observation.to_json()
+    def _save_observations(self, observations: list):
+        """Save several observations with a single executemany."""
+        try:
+            self.db.insert_observations_bulk(
+                [self._observation_row(obs) for obs in observations]
+            )
+        except Exception as e:
+            logger.error(f"Error persisting observation batch: {e}")
+    
+    def _event_row(self, event: HeroTurnEvent) -> tuple:
+        """Build an events insert tuple for insert_events_bulk."""
+        return (
+            self.session_id, event.window_id, to_epoch_us(event.timestamp),
+            "HERO_TURN", event.observation.to_json()
         )
     
-    def _save_decision(self, data: dict):
-        """Save decision to database."""
+    def _save_events(self, events: list):
+        """Save several events with a single executemany."""
+        try:
+            self.db.insert_events_bulk([self._event_row(event) for event in events])
+        except Exception as e:
+            logger.error(f"Error persisting event batch: {e}")
+    
+    def _save_decision(self, data: dict, ts: Optional[int] = None):
+        """
+        Save decision to database.
+        
+        Args:
+            data: Dict with 'observation' and 'decision' keys
+            ts: Decision timestamp in epoch microseconds (defaults to now)
+        """
         observation = data.get("observation")
         decision = data.get("decision")
         
@@ -94,7 +112,7 @@ class PersistenceWorker:
             self.db.insert_decision(
                 session_id=self.session_id,
                 window_id=observation.window_id,
-                timestamp=datetime.now(),
+                timestamp=ts or now_epoch_us(),
                 stage=observation.stage.value,
                 hero_position=observation.hero_position.value,
                 recommended_action=decision.action.value,
@@ -102,6 +120,51 @@ class PersistenceWorker:
                 confidence=decision.confidence
             )
     
+    def _drain_batch(self, first: dict) -> list:
+        """
+        Collect queued items after the first, up to BATCH_MAX_ITEMS.
+        
+        Args:
+            first: Item already taken from the queue
+        
+        Returns:
+            List of items to process
+        """
+        batch = [first]
+        while len(batch) < BATCH_MAX_ITEMS:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _process_batch(self, batch: list):
+        """
+        Process a batch of items with one shared timestamp.
+        
+        Observations and events are each written together with
+        executemany; other items go through _process_item one by one.
+        """
+        batch_ts = now_epoch_us()
+        observations = []
+        events = []
+        for item in batch:
+            item_type = item.get("type")
+            if item_type == "observation":
+                observations.append(item.get("data"))
+            elif item_type == "event":
+                events.append(item.get("data"))
+            else:
+                self._process_item(item, batch_ts)
+        
+        if observations:
+            self._save_observations(observations)
+        if events:
+            self._save_events(events)
+        
+        for _ in batch:
+            self._queue.task_done()
+    
     def _worker_loop(self):
         """Main worker loop."""
         logger.info("Persistence worker started")
@@ -110,21 +173,19 @@ class PersistenceWorker:
             try:
                 # Get item with timeout to allow checking _running flag
                 item = self._queue.get(timeout=0.5)
-                self._process_item(item)
-                self._queue.task_done()
+                self._process_batch(self._drain_batch(item))
             except queue.Empty:
                 continue
             except Exception as e:
                 logger.error(f"Worker loop error: {e}")
         
         # Process remaining items before stopping
-        while not self._queue.empty():
+        while True:
             try:
                 item = self._queue.get_nowait()
-                self._process_item(item)
-                self._queue.task_done()
             except queue.Empty:
                 break
+            self._process_batch(self._drain_batch(item))
         
         logger.info("Persistence worker stopped")
     
@@ -2,47 +2,113 @@
 State polling worker.
 Monitors poker windows for state changes and emits events when hero's turn is detected.
 """
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
-from typing import Callable, Dict, List, Optional
+from functools import partial
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple
 import logging
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+
 from ..app.config import PollerConfig, TableConfig, Region
-from ..capture.screen_capture import ScreenCapture, capture_region, capture_pixel
+from ..capture.screen_capture import (
+    LatestFrameCapture, ScreenCapture, capture_region, capture_pixel,
+    crop_region_image, frame_pixel
+)
 from ..capture.window_manager import WindowManager, RegisteredWindow
 from ..capture.window_registry import WindowRegistry, TableWindow
-from ..vision.card_recognition import CardRecognizer, build_hole_cards, build_board_cards
+from ..vision.card_recognition import (
+    CardRecognizer, binarize_rank, build_hole_cards, build_board_cards, has_rank_glyph
+)
 from ..vision.ui_state import UIStateDetector
 from ..poker.models import (
     Observation, Stage, Position, HoleCards, BoardCards, HeroTurnEvent
 )
-from ..poker.positions import get_hero_position, get_active_positions
+from ..poker.positions import get_hero_position, get_active_positions_tuple
 
 
 logger = logging.getLogger(__name__)
 
+# Max windows polled concurrently
+MAX_POLL_WORKERS = 8
+
+# Seconds after a new hand during which a window counts as hot
+HOT_HAND_SECONDS = 10.0
+
+# Ticks the poll loop may fall behind before it resyncs its deadline
+MAX_LATE_TICKS = 5
 
-@dataclass
+# Window enumeration is slow and rarely changes - refresh at 1 Hz
+WINDOW_REFRESH_SECONDS = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class DebugInfo:
+    """Snapshot of what the on_debug callback shows for one window."""
+    dealer_seat: Optional[int]
+    active_count: int
+    active_seats: tuple
+    is_turn: bool
+    hero_cards: Optional[str]
+    decision: Optional[str]
+    hand_id: Optional[str]
+    is_new_hand: bool
+    hero_stack_bb: Optional[float]
+
+
+@dataclass(slots=True)
 class WindowState:
     """Tracked state for a single window."""
     window_id: str
     last_observation: Optional[Observation] = None
     last_turn_state: bool = False
     consecutive_turn_signals: int = 0
+    # Relative timing below uses time.monotonic() - immune to wall-clock steps
     last_update_time: float = 0.0
     new_hand_detected_time: float = 0.0  # Time when new hand was detected
     last_hand_id: Optional[str] = None
     turn_detected_time: float = 0.0  # Time when turn=true was first detected
     cards_recognized: bool = False  # True after cards successfully recognized
-    card_votes: list = None  # List of recognized cards for voting (accumulates over polls)
+    card_votes: list = field(default_factory=list)  # Recognized cards for voting (accumulates over polls)
     final_cards: object = None  # Final cards after voting (cached until new hand)
     final_decision: object = None  # Final decision (cached until new hand)
+    last_debug: Optional[DebugInfo] = None  # Debug info last sent to on_debug
+    debug_cards: object = None  # Cards last formatted for debug output
+    debug_cards_str: Optional[str] = None  # str(debug_cards)
+    
+    vote_counts: dict = field(default_factory=dict)  # HoleCards.id -> votes among card_votes
+    best_vote: object = None  # HoleCards with the most votes so far
+    best_vote_count: int = 0
     
     # Settings for voting
-    VOTE_SAMPLES_NEEDED: int = 9  # Number of samples before voting
+    VOTE_SAMPLES_NEEDED: ClassVar[int] = 9  # Number of samples before voting
+    
+    def reset_card_votes(self, keep: Optional[list] = None):
+        """
+        Reset card voting, optionally re-tallying some kept votes.
+        
+        Args:
+            keep: Votes to start from (empty if None)
+        """
+        self.card_votes.clear()
+        self.vote_counts.clear()
+        self.best_vote = None
+        self.best_vote_count = 0
+        for cards in keep or ():
+            self.add_card_vote(cards)
+    
+    def add_card_vote(self, cards: HoleCards):
+        """Add a vote, updating the tally and current leader incrementally."""
+        self.card_votes.append(cards)
+        key = cards.id
+        count = self.vote_counts.get(key, 0) + 1
+        self.vote_counts[key] = count
+        if count > self.best_vote_count:
+            self.best_vote = cards
+            self.best_vote_count = count
 
 
 class TurnEventCallback:
@@ -51,6 +117,55 @@ class TurnEventCallback:
         pass
 
 
+@dataclass(frozen=True, slots=True)
+class CardLayout:
+    """
+    Card regions of one window, resolved once from its TableConfig.
+    
+    Saves re-reading and re-validating config attributes for every
+    card on every poll.
+    """
+    hero_ranks: Tuple[Region, Region]
+    hero_suits: Tuple[Tuple[int, int], Tuple[int, int]]  # (x, y) suit pixels
+    board: Tuple[Tuple[Region, Tuple[int, int]], ...]  # (rank region, suit pixel)
+    
+    @classmethod
+    def from_config(cls, config: TableConfig) -> "CardLayout":
+        """
+        Resolve card regions from a table config.
+        
+        Args:
+            config: Table configuration
+        
+        Returns:
+            CardLayout for the config
+        """
+        board = []
+        for region_dict in config.board_card_regions:
+            if not isinstance(region_dict, dict):
+                continue
+            
+            number_region = region_dict.get('number')
+            suit_region = region_dict.get('suit')
+            if not number_region or not suit_region:
+                continue
+            
+            # Suit color is sampled at the center of the suit region
+            suit_xy = (
+                suit_region.left + suit_region.width // 2,
+                suit_region.top + suit_region.height // 2,
+            )
+            board.append((number_region, suit_xy))
+        
+        suit1 = config.hero_card1_suit_pixel
+        suit2 = config.hero_card2_suit_pixel
+        return cls(
+            hero_ranks=(config.hero_card1_number, config.hero_card2_number),
+            hero_suits=((suit1.left, suit1.top), (suit2.left, suit2.top)),
+            board=tuple(board),
+        )
+
+
 class StatePoller:
     """
     Polls poker windows for state changes and detects hero's turn.
@@ -99,11 +214,20 @@ class StatePoller:
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         
+        # Window enumeration runs on its own slow timer, off the poll loop
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._cached_active: List = []
+        
+        # Windows are polled in parallel (screen grabs and OCR release the GIL)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         # Per-window UI detectors (to preserve state like last_hand_id)
         self._ui_detectors: Dict[str, UIStateDetector] = {}
+        self._card_layouts: Dict[str, CardLayout] = {}
         
         # Recognition components
         self._capture = ScreenCapture()
+        self._frame_source: Optional[LatestFrameCapture] = None  # Set in start() if async_capture
         self._recognizer = CardRecognizer()
         
         # Preflop decision engine (RFI-only mode by default)
@@ -113,14 +237,19 @@ class StatePoller:
         # Debounce settings
         self._debounce_signals = 1  # Number of consecutive signals needed (instant)
         
-        # Manual card overrides: {window_id: "KsQh"}
-        self._card_overrides: Dict[str, str] = {}
+        # Manual card overrides: {window_id: HoleCards}. Written under _lock,
+        # read without it - a single dict.get is atomic under the GIL
+        self._card_overrides: Dict[str, HoleCards] = {}
     
     def _get_or_create_state(self, window_id: str) -> WindowState:
         """Get or create window state."""
-        if window_id not in self._window_states:
-            self._window_states[window_id] = WindowState(window_id=window_id)
-        return self._window_states[window_id]
+        # Lock-free fast path: states are only ever added, and dict.get is atomic
+        state = self._window_states.get(window_id)
+        if state is not None:
+            return state
+        
+        with self._lock:
+            return self._window_states.setdefault(window_id, WindowState(window_id=window_id))
     
     def set_card_override(self, window_id: str, cards_str: str):
         """
@@ -178,6 +307,8 @@ class StatePoller:
         Returns:
             Observation or None if detection failed
         """
+        # Single monotonic read shared by all timing decisions in this poll
+        current_time = time.monotonic()
         window_offset = window.info.get_screen_offset()
         window_id = window.window_id
         
@@ -190,35 +321,54 @@ class StatePoller:
         # Get or create UI state detector for this window (preserves state)
         if window_id not in self._ui_detectors:
             self._ui_detectors[window_id] = UIStateDetector(table_config, self._capture)
+            self._card_layouts[window_id] = CardLayout.from_config(table_config)
         detector = self._ui_detectors[window_id]
+        layout = self._card_layouts[window_id]
         
-        # Detect UI state
-        ui_state = detector.get_full_state(window_offset)
-        
+        # One screen grab for the whole client area - regions are cut from it.
+        # With async capture, crop from the background thread's latest frame.
+        state = self._get_or_create_state(window_id)
+        client_size = window.info.client_size
+        frame = None
+        if self._frame_source is not None:
+            frame = self._frame_source.crop_window(window_offset, client_size)
+        if frame is None:
+            frame = self._capture.capture_full_window(window_offset, client_size)
+        
+        # Pixel probes first - cheap, and they tell whether a hand is running
+        ui_state = detector.get_full_state(window_offset, frame)
         dealer_result = ui_state["dealer"]
         active_result = ui_state["active_players"]
         turn_result = ui_state["hero_turn"]
         
+        # Get dealer seat (required for position calculation).
+        # Checked before any OCR so idle tables cost only the probe pass.
+        if dealer_result.seat_index is None:
+            return None  # No dealer = not at table or between hands
+        
         # Detect hand ID for new hand detection
-        hand_result = detector.detect_hand_id(window_offset)
+        hand_result = detector.detect_hand_id(window_offset, frame)
+        
+        # Steady state: preflop decision made for this hand - only watch turn,
+        # seats and hand ID until the flop lands (then full polls take over)
+        if (state.final_decision is not None and not hand_result.is_new_hand
+                and state.last_observation is not None
+                and state.last_observation.stage == Stage.PREFLOP
+                and not self._board_present(window_offset, layout, frame)):
+            return self._steady_state_observation(
+                state, turn_result, hand_result, active_result,
+                table_config.hero_seat_index
+            )
         
-        # Detect hero stack
-        stack_result = detector.detect_hero_stack(window_offset)
-        hero_stack_bb = stack_result.stack_bb
+        hero_stack_bb = detector.detect_hero_stack(window_offset, frame).stack_bb
         
         # Track new hand timing for card recognition delay
-        import time
-        state = self._get_or_create_state(window_id)
         if hand_result.is_new_hand:
-            state.new_hand_detected_time = time.time()
+            state.new_hand_detected_time = current_time
             state.last_hand_id = hand_result.hand_id
         
         # Debug info will be sent after card recognition (below)
         
-        # Get dealer seat (required for position calculation)
-        if dealer_result.seat_index is None:
-            return None  # No dealer = not at table or between hands
-        
         dealer_seat = dealer_result.seat_index
         
         # Calculate hero position
@@ -231,40 +381,32 @@ class StatePoller:
         # Calculate active player positions
         # Include hero seat in active seats list
         all_active_seats = active_result.active_seats + [table_config.hero_seat_index]
-        active_positions = tuple(get_active_positions(
-            all_active_seats, dealer_seat, total_seats=8
-        ))
+        active_positions = get_active_positions_tuple(
+            tuple(all_active_seats), dealer_seat, total_seats=8
+        )
         
         # Recognize hero cards using per-window config
         # Logic: recognize until turn=true + 3 seconds, then stop
-        current_time = time.time()
-        
         # Track when turn was first detected
         if turn_result.is_hero_turn and state.turn_detected_time == 0:
             state.turn_detected_time = current_time
-            logger.debug(f"Turn detected at {current_time}")
+            logger.debug("Turn detected at %s", current_time)
         
         # Reset on new hand
         if hand_result.is_new_hand:
             state.turn_detected_time = 0.0
             state.cards_recognized = False
             state.new_hand_detected_time = current_time
-            state.card_votes = []  # Reset voting
+            state.reset_card_votes()
             state.final_cards = None
             state.final_decision = None
             # Clear manual override on new hand
             with self._lock:
-                if window_id in self._card_overrides:
-                    del self._card_overrides[window_id]
+                self._card_overrides.pop(window_id, None)
             state.final_decision = None
         
-        # Initialize card_votes if None
-        if state.card_votes is None:
-            state.card_votes = []
-        
-        # Check for manual card override first
-        with self._lock:
-            override_cards = self._card_overrides.get(window_id)
+        # Check for manual card override first (lock-free read)
+        override_cards = self._card_overrides.get(window_id)
         
         # Decide whether to recognize cards
         # Logic: recognize cards until turn=true + 3 seconds, then use final result
@@ -283,39 +425,41 @@ class StatePoller:
             hero_cards = state.final_cards
         else:
             # Recognize cards and accumulate votes (single recognition per poll)
-            recognized = self._recognize_hero_cards_single(window_offset, table_config)
+            recognized = self._recognize_hero_cards_single(window_offset, layout, frame)
             if recognized:
-                state.card_votes.append(recognized)
-                logger.debug(f"Card vote {len(state.card_votes)}/{state.VOTE_SAMPLES_NEEDED}: {recognized}")
+                state.add_card_vote(recognized)
+                logger.debug(
+                    "Card vote %d/%d: %s",
+                    len(state.card_votes), state.VOTE_SAMPLES_NEEDED, recognized
+                )
             
-            # Check if we have enough votes for finalization
-            if len(state.card_votes) >= state.VOTE_SAMPLES_NEEDED:
-                from collections import Counter
-                # Vote on cards (use string representation for hashing)
-                votes = [str(c) for c in state.card_votes]
-                counter = Counter(votes)
-                most_common, count = counter.most_common(1)[0]
-                
-                # Require majority (at least 5 out of 9)
-                if count >= (state.VOTE_SAMPLES_NEEDED // 2 + 1):
-                    # Find the actual HoleCards object
-                    for c in state.card_votes:
-                        if str(c) == most_common:
-                            state.final_cards = c
-                            break
-                    logger.info(f"CARDS FINALIZED by voting ({count}/{len(votes)}): {state.final_cards}")
-                else:
-                    # No clear winner - keep oldest half, accumulate more
-                    logger.debug(f"Voting uncertain: {counter.most_common(3)}, continuing...")
-                    state.card_votes = state.card_votes[-(state.VOTE_SAMPLES_NEEDED // 2):]
+            # Majority (at least 5 out of 9) - once reached, further samples can't change it
+            majority = state.VOTE_SAMPLES_NEEDED // 2 + 1
+            if state.best_vote_count >= majority:
+                state.final_cards = state.best_vote
+                logger.info(
+                    "CARDS FINALIZED by voting (%d/%d): %s",
+                    state.best_vote_count, len(state.card_votes), state.final_cards
+                )
+            elif len(state.card_votes) >= state.VOTE_SAMPLES_NEEDED:
+                # No clear winner - keep newest half, accumulate more
+                logger.debug(
+                    "Voting uncertain: leader %s (%d/%d), continuing...",
+                    state.best_vote, state.best_vote_count, len(state.card_votes)
+                )
+                state.reset_card_votes(keep=state.card_votes[-(state.VOTE_SAMPLES_NEEDED // 2):])
             
             hero_cards = recognized
         
         # Detect board cards
-        board_cards = self._recognize_board_cards(window_offset, table_config)
+        board_cards = self._recognize_board_cards(window_offset, layout, frame)
         stage = board_cards.get_stage()
         
-        # Build observation
+        # Final cards from voting take precedence over this poll's sample
+        if state.final_cards is not None:
+            hero_cards = state.final_cards
+        
+        # Build observation (wall-clock timestamp; gates above are monotonic)
         observation = Observation(
             timestamp=datetime.now(),
             window_id=window_id,
@@ -338,53 +482,151 @@ class StatePoller:
         # Only show final decision after cards are finalized by voting
         decision = None
         if state.final_cards and self._preflop_engine and stage == Stage.PREFLOP:
-            # Use final cards from voting for decision
-            observation_with_final = Observation(
-                timestamp=observation.timestamp,
-                window_id=observation.window_id,
-                stage=observation.stage,
-                hero_position=observation.hero_position,
-                dealer_seat=observation.dealer_seat,
-                active_players_count=observation.active_players_count,
-                active_positions=observation.active_positions,
-                hero_cards=state.final_cards,
-                board_cards=observation.board_cards,
-                is_hero_turn=observation.is_hero_turn,
-                hero_stack_bb=observation.hero_stack_bb,
-                confidence=observation.confidence,
-            )
+            # Observation already carries the final cards from voting
             if state.final_decision is None:
-                state.final_decision = self._preflop_engine.get_decision(observation_with_final)
+                state.final_decision = self._preflop_engine.get_decision(observation)
                 if state.final_decision:
-                    logger.info(f"FINAL DECISION: {state.final_decision.action.value} ({state.final_decision.reasoning})")
+                    logger.info(
+                        "FINAL DECISION: %s (%s)",
+                        state.final_decision.action.value, state.final_decision.reasoning
+                    )
             decision = state.final_decision
         
-        # Send debug info (always, after decision is known)
+        # Send debug info (after decision is known; skipped if unchanged)
         if self._on_debug:
-            # Show final cards after voting, or current sample during accumulation
+            # Show final cards after voting, or current sample during accumulation;
+            # only re-format when the cards object changed
             display_cards = state.final_cards if state.final_cards else hero_cards
-            cards_str = str(display_cards) if display_cards else None
+            if display_cards is not state.debug_cards:
+                state.debug_cards = display_cards
+                state.debug_cards_str = str(display_cards) if display_cards else None
             # Use final_decision if available (persists after turn ends)
             display_decision = decision if decision else state.final_decision
-            decision_str = display_decision.action.value if display_decision else None
-            self._on_debug(window_id, {
-                "dealer_seat": dealer_result.seat_index,
-                "active_count": active_result.count,
-                "active_seats": active_result.active_seats,
-                "is_turn": turn_result.is_hero_turn,
-                "hero_cards": cards_str,
-                "decision": decision_str,
-                "hand_id": hand_result.hand_id,
-                "is_new_hand": hand_result.is_new_hand,
-                "hero_stack_bb": hero_stack_bb,
-            })
+            
+            self._emit_debug(state, DebugInfo(
+                dealer_seat=dealer_result.seat_index,
+                active_count=active_result.count,
+                active_seats=tuple(active_result.active_seats),
+                is_turn=turn_result.is_hero_turn,
+                hero_cards=state.debug_cards_str,
+                decision=display_decision.action.value if display_decision else None,
+                hand_id=hand_result.hand_id,
+                is_new_hand=hand_result.is_new_hand,
+                hero_stack_bb=hero_stack_bb,
+            ))
+        
+        return observation
+    
+    def _steady_state_observation(
+        self,
+        state: WindowState,
+        turn_result,
+        hand_result,
+        active_result,
+        hero_seat_index: int
+    ) -> Observation:
+        """
+        Build observation once the hand's preflop decision is final.
+        
+        Only taken while the board is empty: dealer and hole cards can't
+        change until the next hand, so the turn indicator and active seats
+        (both from the pixel probes) are refreshed and the rest is carried
+        over from the last full observation. The stack is not re-read - it
+        only fed the decision, which is already final.
+        
+        Args:
+            state: Window state with last_observation and final_decision
+            turn_result: Turn detection result of this poll
+            hand_result: Hand ID result of this poll
+            active_result: Active players result of this poll
+            hero_seat_index: Hero's seat, counted as active
+        
+        Returns:
+            Observation with refreshed timestamp, turn flag and active seats
+        """
+        last = state.last_observation
+        all_active_seats = active_result.active_seats + [hero_seat_index]
+        observation = replace(
+            last,
+            timestamp=datetime.now(),
+            hero_cards=state.final_cards,
+            is_hero_turn=turn_result.is_hero_turn,
+            active_players_count=len(all_active_seats),
+            active_positions=get_active_positions_tuple(
+                tuple(all_active_seats), last.dealer_seat, total_seats=8
+            ),
+        )
+        
+        if self._on_debug and state.last_debug:
+            self._emit_debug(state, replace(
+                state.last_debug,
+                active_count=active_result.count,
+                active_seats=tuple(active_result.active_seats),
+                is_turn=turn_result.is_hero_turn,
+                hand_id=hand_result.hand_id,
+                is_new_hand=False,
+            ))
         
         return observation
     
+    def _board_present(self, window_offset: tuple, layout: CardLayout, frame) -> bool:
+        """
+        Cheap flop check: is there a rank glyph in the first board slot?
+        
+        Binarizes one crop without OCR, so the steady-state path can
+        notice the flop and hand over to a full poll.
+        
+        Args:
+            window_offset: Window screen offset
+            layout: Card regions of the window
+            frame: Full-window RGB frame to crop from (captures if None)
+        
+        Returns:
+            True if the first board slot shows a card
+        """
+        if not layout.board:
+            return False
+        rank_img = self._grab_image(layout.board[0][0], window_offset, frame)
+        if rank_img is None:
+            return False
+        return has_rank_glyph(binarize_rank(np.asarray(rank_img.convert('L'))))
+    
+    def _emit_debug(self, state: WindowState, info: DebugInfo):
+        """
+        Send debug info to on_debug, but only when it changed.
+        
+        Idle tables repeat the same state every poll; skipping those
+        saves the callback (a cross-thread UI signal) and its dict.
+        
+        Args:
+            state: Window state holding the last info sent
+            info: Debug info of this poll
+        """
+        if info == state.last_debug:
+            return
+        
+        state.last_debug = info
+        self._on_debug(state.window_id, asdict(info))
+    
+    @staticmethod
+    def _grab_image(region: Region, window_offset: tuple, frame) -> Optional[object]:
+        """Cut region from the window frame as PIL Image, or capture it if no frame."""
+        if frame is not None:
+            return crop_region_image(frame, region)
+        return capture_region(region, window_offset)
+    
+    @staticmethod
+    def _grab_pixel(x: int, y: int, window_offset: tuple, frame) -> Optional[tuple]:
+        """Read pixel from the window frame, or capture it if no frame."""
+        if frame is not None:
+            return frame_pixel(frame, x, y)
+        return capture_pixel(x, y, window_offset)
+    
     def _recognize_hero_cards_single(
         self,
         window_offset: tuple,
-        table_config: Optional[TableConfig] = None
+        layout: CardLayout,
+        frame=None
     ) -> Optional[HoleCards]:
         """
         Recognize hero's hole cards (single sample for voting accumulation).
@@ -394,20 +636,20 @@ class StatePoller:
         
         Args:
             window_offset: Window screen offset
-            table_config: Table configuration with card regions
+            layout: Card regions of the window
+            frame: Full-window RGB frame to crop from (captures if None)
         
         Returns:
             HoleCards or None if recognition failed
         """
-        config = table_config or self.table_config
+        region1, region2 = layout.hero_ranks
+        grab_image = self._grab_image
+        grab_pixel = self._grab_pixel
+        recognizer = self._recognizer
         
         # Capture rank images
-        card1_rank_img = capture_region(
-            config.hero_card1_number, window_offset
-        )
-        card2_rank_img = capture_region(
-            config.hero_card2_number, window_offset
-        )
+        card1_rank_img = grab_image(region1, window_offset, frame)
+        card2_rank_img = grab_image(region2, window_offset, frame)
         
         # Check rank images captured
         if not all([card1_rank_img, card2_rank_img]):
@@ -415,26 +657,25 @@ class StatePoller:
             return None
         
         # Recognize ranks using OCR
-        rank1, _ = self._recognizer.recognize_rank_ocr(card1_rank_img)
-        rank2, _ = self._recognizer.recognize_rank_ocr(card2_rank_img)
+        rank1, _ = recognizer.recognize_rank_ocr(card1_rank_img)
+        rank2, _ = recognizer.recognize_rank_ocr(card2_rank_img)
         
         if not rank1 or not rank2:
-            logger.debug(f"OCR failed: rank1={rank1} rank2={rank2}")
+            logger.debug("OCR failed: rank1=%s rank2=%s", rank1, rank2)
             return None
         
         # Recognize suits using color detection (faster and more reliable)
-        suit1_pixel = config.hero_card1_suit_pixel
-        suit2_pixel = config.hero_card2_suit_pixel
+        (x1, y1), (x2, y2) = layout.hero_suits
         
-        color1 = capture_pixel(suit1_pixel.left, suit1_pixel.top, window_offset)
-        color2 = capture_pixel(suit2_pixel.left, suit2_pixel.top, window_offset)
+        color1 = grab_pixel(x1, y1, window_offset, frame)
+        color2 = grab_pixel(x2, y2, window_offset, frame)
         
         if not color1 or not color2:
             logger.debug("Suit pixel capture failed")
             return None
         
-        suit1, _ = self._recognizer.recognize_suit_by_color(color1)
-        suit2, _ = self._recognizer.recognize_suit_by_color(color2)
+        suit1, _ = recognizer.recognize_suit_by_color(color1)
+        suit2, _ = recognizer.recognize_suit_by_color(color2)
         
         # Build cards
         try:
@@ -443,68 +684,69 @@ class StatePoller:
             card2 = Card(rank=rank2, suit=suit2)
             
             if card1 == card2:
-                logger.debug(f"Duplicate cards detected: {card1}")
+                logger.debug("Duplicate cards detected: %s", card1)
                 return None
             
             return HoleCards(card1=card1, card2=card2)
         except Exception as e:
-            logger.debug(f"Card creation failed: {e}")
+            logger.debug("Card creation failed: %s", e)
             return None
     
     def _recognize_board_cards(
         self,
         window_offset: tuple,
-        table_config: Optional[TableConfig] = None
+        layout: CardLayout,
+        frame=None
     ) -> BoardCards:
         """
         Recognize board cards (flop/turn/river).
         
         Args:
             window_offset: Window screen offset
-            table_config: Table configuration with board regions
+            layout: Card regions of the window
+            frame: Full-window RGB frame to crop from (captures if None)
         
         Returns:
             BoardCards (empty if preflop or recognition failed)
         """
-        config = table_config or self.table_config
-        cards = []
-        
-        for region_dict in config.board_card_regions:
-            if not isinstance(region_dict, dict):
-                continue
-            
-            number_region = region_dict.get('number')
-            suit_region = region_dict.get('suit')
+        rank_imgs = []
+        suit_rgbs = []
+        grab_image = self._grab_image
+        grab_pixel = self._grab_pixel
+        
+        for number_region, (suit_x, suit_y) in layout.board:
+            # Capture rank image and suit color
+            rank_img = grab_image(number_region, window_offset, frame)
+            suit_rgb = grab_pixel(suit_x, suit_y, window_offset, frame)
             
-            if not number_region or not suit_region:
-                continue
-            
-            # Capture images
-            rank_img = capture_region(number_region, window_offset)
-            suit_img = capture_region(suit_region, window_offset)
-            
-            if not rank_img or not suit_img:
+            if not rank_img or not suit_rgb:
                 # No more cards on board
                 break
             
-            # Recognize card
-            result = self._recognizer.recognize_card(rank_img, suit_img)
-            
+            rank_imgs.append(rank_img)
+            suit_rgbs.append(suit_rgb)
+        
+        cards = []
+        seen = set()
+        
+        # Recognize all slots in one batch (stops at first unrecognizable card)
+        for result in self._recognizer.recognize_batch(rank_imgs, suit_rgbs):
             if not result.is_valid:
                 # Card not recognizable - likely no card there
                 break
             
             # Check for duplicates
-            if any(str(c) == str(result.card) for c in cards):
-                logger.warning(f"Duplicate board card detected: {result.card}")
+            if result.card in seen:
+                logger.warning("Duplicate board card detected: %s", result.card)
                 continue
             
+            seen.add(result.card)
             cards.append(result.card)
         
         # Validate board card count (must be 0, 3, 4, or 5)
         valid_counts = (0, 3, 4, 5)
         if len(cards) not in valid_counts:
-            logger.debug(f"Invalid board card count: {len(cards)}, using empty board")
+            logger.debug("Invalid board card count: %d, using empty board", len(cards))
             return BoardCards.empty()
         
         return BoardCards(cards=tuple(cards))
@@ -545,47 +787,108 @@ class StatePoller:
                 
                 state.last_turn_state = True
                 logger.info(
-                    f"[{observation.window_id}] Hero turn detected - "
-                    f"Position: {observation.hero_position.value}, "
-                    f"Cards: {observation.hero_cards}"
+                    "[%s] Hero turn detected - Position: %s, Cards: %s",
+                    observation.window_id, observation.hero_position.value,
+                    observation.hero_cards
                 )
         else:
             state.consecutive_turn_signals = 0
             state.last_turn_state = False
         
         state.last_observation = observation
-        state.last_update_time = time.time()
+        state.last_update_time = time.monotonic()
+    
+    def _next_interval(self, now: float, any_dealer: bool) -> float:
+        """
+        Pick the poll interval from current table activity.
+        
+        Args:
+            now: Current time.monotonic() reading
+            any_dealer: True if any window showed a dealer button this cycle
+        
+        Returns:
+            Seconds between polls: idle_interval with no table in a hand,
+            hot_interval right after a new hand or while cards are still
+            being voted after the turn, base poll frequency otherwise
+        """
+        if not any_dealer:
+            return self.config.idle_interval
+        
+        with self._lock:
+            states = list(self._window_states.values())
+        
+        for state in states:
+            if 0 < now - state.new_hand_detected_time < HOT_HAND_SECONDS:
+                return self.config.hot_interval
+            if state.turn_detected_time > 0 and state.final_cards is None:
+                return self.config.hot_interval
+        
+        return 1.0 / self.config.poll_frequency_hz
+    
+    def _refresh_windows(self):
+        """Re-enumerate windows and cache the active list for the poll loop."""
+        if self.window_registry:
+            self.window_registry.refresh_all()
+            active = self.window_registry.get_active_windows()
+        elif self.window_manager:
+            self.window_manager.refresh_all()
+            active = self.window_manager.get_active_windows()
+        else:
+            active = []
+        
+        with self._lock:
+            self._cached_active = active
+    
+    def _refresh_loop(self):
+        """Background loop refreshing the window list every WINDOW_REFRESH_SECONDS."""
+        while self._running:
+            try:
+                self._refresh_windows()
+            except Exception as e:
+                logger.error(f"Window refresh error: {e}")
+            time.sleep(WINDOW_REFRESH_SECONDS)
     
     def _poll_loop(self):
         """Main polling loop."""
         interval = 1.0 / self.config.poll_frequency_hz
+        executor = self._executor
         
         logger.info(
             f"Starting poll loop at {self.config.poll_frequency_hz} Hz "
-            f"(interval: {interval*1000:.0f}ms)"
+            f"(interval: {interval*1000:.0f}ms, hot: {self.config.hot_interval*1000:.0f}ms, "
+            f"idle: {self.config.idle_interval*1000:.0f}ms)"
         )
         
+        # Absolute tick deadline - a slow poll shortens the next sleep
+        # instead of pushing every later tick back
+        next_tick = time.monotonic()
+        
         while self._running:
-            start_time = time.time()
+            start_time = time.monotonic()
+            any_dealer = False
             
             try:
-                # Get windows to poll - prefer registry over manager
-                windows_to_poll = []
+                # Windows to poll, as last enumerated by the refresh thread
+                with self._lock:
+                    windows_to_poll = self._cached_active
                 
-                if self.window_registry:
-                    self.window_registry.refresh_all()
-                    windows_to_poll = self.window_registry.get_active_windows()
-                elif self.window_manager:
-                    self.window_manager.refresh_all()
-                    windows_to_poll = self.window_manager.get_active_windows()
+                # Poll active windows in parallel, handle results in order.
+                # A single table is polled inline - no executor hand-off.
+                if len(windows_to_poll) > 1:
+                    results = [
+                        executor.submit(self._poll_window, window).result
+                        for window in windows_to_poll
+                    ]
+                else:
+                    results = [partial(self._poll_window, window) for window in windows_to_poll]
                 
-                # Poll each active window
-                for window in windows_to_poll:
+                for window, result in zip(windows_to_poll, results):
                     state = self._get_or_create_state(window.window_id)
                     
                     try:
-                        observation = self._poll_window(window)
+                        observation = result()
                         if observation:
+                            any_dealer = True
                             self._handle_observation(observation, state)
                     except Exception as e:
                         logger.error(f"Error polling {window.window_id}: {e}")
@@ -596,11 +899,15 @@ class StatePoller:
             except Exception as e:
                 logger.error(f"Poll loop error: {e}")
             
-            # Sleep for remaining interval
-            elapsed = time.time() - start_time
-            sleep_time = max(0, interval - elapsed)
+            # Sleep until the next tick (interval adapted to table activity)
+            interval = self._next_interval(start_time, any_dealer)
+            next_tick += interval
+            sleep_time = next_tick - time.monotonic()
             if sleep_time > 0:
                 time.sleep(sleep_time)
+            elif sleep_time < -interval * MAX_LATE_TICKS:
+                # Far behind (e.g. system sleep) - resync instead of bursting
+                next_tick = time.monotonic()
     
     def start(self):
         """Start the polling thread."""
@@ -608,9 +915,29 @@ class StatePoller:
             logger.warning("Poller already running")
             return
         
-        # OCR-based recognition - no templates needed
+        # OCR-based recognition - no templates needed; pay Tesseract's
+        # cold start now rather than on the first hero turn
+        self._recognizer.warm_up()
+        
+        if self.config.async_capture:
+            self._frame_source = LatestFrameCapture(
+                target_fps=self.config.poll_frequency_hz * 2
+            )
+            self._frame_source.start()
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_POLL_WORKERS,
+            thread_name_prefix="poll"
+        )
+        # Populate the window list before the first poll
+        try:
+            self._refresh_windows()
+        except Exception as e:
+            logger.error(f"Window refresh error: {e}")
         
         self._running = True
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._refresh_thread.start()
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
         logger.info("State poller started")
@@ -623,6 +950,21 @@ class StatePoller:
             self._thread.join(timeout=2.0)
             self._thread = None
         
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout=WINDOW_REFRESH_SECONDS + 1.0)
+            self._refresh_thread = None
+        
+        if self._executor:
+            # Wait for in-flight polls - they may be using a detector's OCR API
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        if self._frame_source:
+            self._frame_source.stop()
+            self._frame_source = None
+        
+        for detector in self._ui_detectors.values():
+            detector.close()
         self._capture.close()
         logger.info("State poller stopped")
     
@@ -2,7 +2,6 @@
 Tests for calibration utilities.
 """
 import pytest
-import tempfile
 from pathlib import Path
 
 from src.capture.calibration import (
@@ -14,6 +13,27 @@ from src.capture.calibration import (
 from src.app.config import TableConfig, Region, PixelCoord, PixelCheck
 
 
+@pytest.fixture(scope="module")
+def sample_table_config():
+    """Calibrated table config shared by the module (treat as read-only)."""
+    return TableConfig(
+        hero_seat_index=4,
+        hero_card1_number=Region(100, 200, 30, 40),
+        hero_card1_suit_pixel=PixelCoord(100, 250),
+        hero_card2_number=Region(140, 200, 30, 40),
+        hero_card2_suit_pixel=PixelCoord(140, 250),
+        dealer_pixels=[
+            PixelCoord(50, 50),
+            PixelCoord(100, 50),
+        ],
+        active_player_pixels=[
+            PixelCheck(60, 60, 40),
+            PixelCheck(110, 60, 42),
+        ],
+        pot_region=Region(400, 300, 130, 35),
+    )
+
+
 class TestCoordinateConversion:
     """Tests for coordinate conversion functions."""
     
@@ -78,53 +98,40 @@ class TestCoordinateConversion:
 class TestCalibrationPersistence:
     """Tests for saving/loading calibration files."""
     
-    def test_save_and_load_calibration(self):
+    @pytest.fixture(scope="class")
+    def calib_dir(self, tmp_path_factory):
+        """One temp directory shared by the class; tests use distinct file names."""
+        return tmp_path_factory.mktemp("calib")
+    
+    def test_save_and_load_calibration(self, calib_dir, sample_table_config):
         """Test round-trip save and load."""
-        config = TableConfig(
-            hero_seat_index=4,
-            hero_card1_number=Region(100, 200, 30, 40),
-            hero_card1_suit_pixel=PixelCoord(100, 250),
-            hero_card2_number=Region(140, 200, 30, 40),
-            hero_card2_suit_pixel=PixelCoord(140, 250),
-            dealer_pixels=[
-                PixelCoord(50, 50),
-                PixelCoord(100, 50),
-            ],
-            active_player_pixels=[
-                PixelCheck(60, 60, 40),
-                PixelCheck(110, 60, 42),
-            ],
-            pot_region=Region(400, 300, 130, 35),
-        )
+        config = sample_table_config
+        path = calib_dir / "roundtrip.json"
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "calibration.json"
-            
-            # Save
-            result = save_calibration(config, path)
-            assert result is True
-            assert path.exists()
-            
-            # Load
-            loaded = load_calibration(path)
-            assert loaded is not None
-            assert loaded.hero_seat_index == config.hero_seat_index
-            assert loaded.hero_card1_number.left == config.hero_card1_number.left
-            assert loaded.hero_card1_number.top == config.hero_card1_number.top
-            assert len(loaded.dealer_pixels) == len(config.dealer_pixels)
+        # Save
+        result = save_calibration(config, path)
+        assert result is True
+        assert path.exists()
+        
+        # Load
+        loaded = load_calibration(path)
+        assert loaded is not None
+        assert loaded.hero_seat_index == config.hero_seat_index
+        assert loaded.hero_card1_number.left == config.hero_card1_number.left
+        assert loaded.hero_card1_number.top == config.hero_card1_number.top
+        assert len(loaded.dealer_pixels) == len(config.dealer_pixels)
     
     def test_load_missing_file(self):
         """Test loading non-existent file returns None."""
         loaded = load_calibration(Path("/nonexistent/path.json"))
         assert loaded is None
     
-    def test_save_creates_directory(self):
+    def test_save_creates_directory(self, calib_dir):
         """Test that save creates parent directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "subdir" / "nested" / "calibration.json"
-            
-            config = TableConfig()
-            result = save_calibration(config, path)
-            
-            assert result is True
-            assert path.exists()
+        path = calib_dir / "subdir" / "nested" / "calibration.json"
+        
+        config = TableConfig()
+        result = save_calibration(config, path)
+        
+        assert result is True
+        assert path.exists()
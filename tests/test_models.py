@@ -4,12 +4,26 @@ Tests for poker models.
 import pytest
 from datetime import datetime
 
+import json
+
 from src.poker.models import (
     Card, HoleCards, BoardCards, Stage, Action, Position,
-    Observation, PreflopDecision
+    Observation, PreflopDecision, ALL_HANDS
 )
 
 
+# Full deck, built once at import and shared by the deck-wide tests
+ALL_CARDS = tuple(Card(rank=r, suit=s) for r in "23456789TJQKA" for s in "shdc")
+
+# (hole cards, expected notation), built once at import
+HAND_NOTATION_CASES = [
+    (HoleCards(card1=Card(rank="T", suit="h"), card2=Card(rank="T", suit="s")), "TT"),
+    (HoleCards(card1=Card(rank="A", suit="h"), card2=Card(rank="K", suit="h")), "AKs"),
+    (HoleCards(card1=Card(rank="A", suit="h"), card2=Card(rank="K", suit="s")), "AKo"),
+    (HoleCards(card1=Card(rank="K", suit="h"), card2=Card(rank="A", suit="s")), "AKo"),
+]
+
+
 class TestCard:
     """Tests for Card model."""
     
@@ -20,17 +34,17 @@ class TestCard:
         assert card.suit == "h"
         assert str(card) == "Ah"
     
-    def test_all_ranks(self):
+    @pytest.mark.parametrize("rank", "23456789TJQKA")
+    def test_all_ranks(self, rank):
         """Test all valid ranks."""
-        for rank in "23456789TJQKA":
-            card = Card(rank=rank, suit="s")
-            assert card.rank == rank
+        card = Card(rank=rank, suit="s")
+        assert card.rank == rank
     
-    def test_all_suits(self):
+    @pytest.mark.parametrize("suit", "shdc")
+    def test_all_suits(self, suit):
         """Test all valid suits."""
-        for suit in "shdc":
-            card = Card(rank="A", suit=suit)
-            assert card.suit == suit
+        card = Card(rank="A", suit=suit)
+        assert card.suit == suit
     
     def test_invalid_rank(self):
         """Test invalid rank raises error."""
@@ -87,6 +101,23 @@ class TestCard:
         card1 = Card(rank="A", suit="h")
         card2 = Card(rank="A", suit="s")
         assert card1 != card2
+    
+    def test_card_ids_unique(self):
+        """Test every card gets a distinct id in 0..51."""
+        ids = {card.id for card in ALL_CARDS}
+        assert ids == set(range(52))
+    
+    def test_card_code_matches_treys_layout(self):
+        """Test card integers use the Cactus Kev layout treys expects."""
+        # Card.new("Kd") in treys
+        assert Card(rank="K", suit="d").code == 134236965
+        assert len({card.code for card in ALL_CARDS}) == 52
+    
+    def test_card_hash_matches_equality(self):
+        """Test equal cards collapse in a set and hash to their id."""
+        cards = {Card(rank="A", suit="h"), Card(rank="A", suit="h"), Card(rank="A", suit="s")}
+        assert len(cards) == 2
+        assert hash(Card(rank="2", suit="s")) == 0
 
 
 class TestHoleCards:
@@ -108,6 +139,17 @@ class TestHoleCards:
         )
         assert hole.to_list() == ["Ah", "Ks"]
     
+    def test_str_is_cached_and_excluded_from_equality(self):
+        """Test str() uses the precomputed string and doesn't affect ==."""
+        hole = HoleCards(
+            card1=Card(rank="A", suit="h"),
+            card2=Card(rank="K", suit="s")
+        )
+        assert str(hole) == "AhKs"
+        assert str(hole) is str(hole)
+        assert hole == HoleCards(card1=Card(rank="A", suit="h"), card2=Card(rank="K", suit="s"))
+        assert "_str" not in repr(hole)
+    
     def test_is_pocket_pair_true(self):
         """Test pocket pair detection - true case."""
         hole = HoleCards(
@@ -140,41 +182,56 @@ class TestHoleCards:
         )
         assert hole.is_suited() is False
     
-    def test_hand_notation_pocket_pair(self):
-        """Test hand notation for pocket pairs."""
-        hole = HoleCards(
-            card1=Card(rank="T", suit="h"),
-            card2=Card(rank="T", suit="s")
-        )
-        assert hole.hand_notation() == "TT"
-    
-    def test_hand_notation_suited(self):
-        """Test hand notation for suited hands."""
-        hole = HoleCards(
-            card1=Card(rank="A", suit="h"),
-            card2=Card(rank="K", suit="h")
-        )
-        assert hole.hand_notation() == "AKs"
-    
-    def test_hand_notation_offsuit(self):
-        """Test hand notation for offsuit hands."""
-        hole = HoleCards(
-            card1=Card(rank="A", suit="h"),
-            card2=Card(rank="K", suit="s")
-        )
-        assert hole.hand_notation() == "AKo"
-    
-    def test_hand_notation_order_independent(self):
-        """Test that hand notation is order independent."""
-        hole1 = HoleCards(
-            card1=Card(rank="K", suit="h"),
-            card2=Card(rank="A", suit="s")
-        )
-        hole2 = HoleCards(
-            card1=Card(rank="A", suit="s"),
-            card2=Card(rank="K", suit="h")
-        )
-        assert hole1.hand_notation() == hole2.hand_notation() == "AKo"
+    @pytest.mark.parametrize("hole,expected", HAND_NOTATION_CASES)
+    def test_hand_notation(self, hole, expected):
+        """Test hand notation for pairs, suited, offsuit, and either card order."""
+        assert hole.hand_notation() == expected
+    
+    def test_hand_notation_covers_169_hands(self):
+        """Test every two-card combo maps onto the 169 canonical hands."""
+        ranks = "AKQJT98765432"
+        canonical = set()
+        for i, high in enumerate(ranks):
+            canonical.add(high + high)
+            for low in ranks[i + 1:]:
+                canonical.add(high + low + "s")
+                canonical.add(high + low + "o")
+        
+        notations = {
+            HoleCards(card1=c1, card2=c2).hand_notation()
+            for i, c1 in enumerate(ALL_CARDS)
+            for c2 in ALL_CARDS[i + 1:]
+        }
+        
+        assert len(canonical) == 169
+        assert notations == canonical
+    
+    def test_id_order_independent(self):
+        """Test pair id ignores card order but distinguishes suits."""
+        hole1 = HoleCards(card1=Card(rank="K", suit="h"), card2=Card(rank="A", suit="s"))
+        hole2 = HoleCards(card1=Card(rank="A", suit="s"), card2=Card(rank="K", suit="h"))
+        hole3 = HoleCards(card1=Card(rank="A", suit="h"), card2=Card(rank="K", suit="h"))
+        assert hole1.id == hole2.id
+        assert hole1.id != hole3.id
+    
+    def test_all_hands_round_trip(self):
+        """Test ALL_HANDS holds each canonical hand once, rebuildable from notation."""
+        notations = [hole.hand_notation() for hole in ALL_HANDS]
+        assert len(set(notations)) == len(ALL_HANDS) == 169
+        for hole, notation in zip(ALL_HANDS, notations):
+            assert HoleCards.from_notation(notation) == hole
+    
+    def test_from_notation_invalid(self):
+        """Test unknown or non-canonical notation is rejected."""
+        with pytest.raises(ValueError):
+            HoleCards.from_notation("KAs")
+    
+    def test_cards_normalized_high_first(self):
+        """Test construction orders the pair high card first."""
+        hole = HoleCards(card1=Card(rank="K", suit="h"), card2=Card(rank="A", suit="s"))
+        assert hole.card1 == Card(rank="A", suit="s")
+        assert str(hole) == "AsKh"
+        assert hole == HoleCards(card1=Card(rank="A", suit="s"), card2=Card(rank="K", suit="h"))
 
 
 class TestBoardCards:
@@ -247,6 +304,68 @@ class TestBoardCards:
         assert board.to_list() == ["Ah", "Ks"]
 
 
+class TestObservationSerialization:
+    """Tests for Observation serialization caching."""
+    
+    @pytest.fixture
+    def observation(self):
+        return Observation(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            window_id="table_1",
+            stage=Stage.PREFLOP,
+            hero_position=Position.BTN,
+            dealer_seat=0,
+            active_players_count=2,
+            active_positions=(Position.BTN, Position.BB),
+            hero_cards=HoleCards(Card("A", "h"), Card("K", "s")),
+            board_cards=BoardCards(cards=()),
+        )
+    
+    def test_to_db_json_fields(self, observation):
+        """Test DB column values are JSON where the column expects it."""
+        fields = observation.to_db_json()
+        
+        assert fields["stage"] == "preflop"
+        assert fields["hero_position"] == "BTN"
+        assert json.loads(fields["active_positions_json"]) == ["BTN", "BB"]
+        assert json.loads(fields["board_cards_json"]) == []
+        assert fields["hero_cards_json"] == "AhKs"
+        assert fields["raw_confidence_json"] is None
+    
+    def test_json_is_compact_without_orjson(self, observation, monkeypatch):
+        """Test the stdlib fallback writes the same compact JSON as orjson."""
+        from src.poker import models
+        monkeypatch.setattr(models, "HAS_ORJSON", False)
+        
+        fields = observation.to_db_json()
+        
+        assert fields["active_positions_json"] == '["BTN","BB"]'
+        assert models._dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+    
+    def test_serialization_is_cached(self, observation):
+        """Test repeated calls return the same cached objects."""
+        assert observation.to_db_json() is observation.to_db_json()
+        assert observation.to_json() is observation.to_json()
+        assert json.loads(observation.to_json())["window_id"] == "table_1"
+    
+    def test_cache_does_not_affect_equality(self, observation):
+        """Test cached fields are ignored by equality."""
+        other = Observation(**{
+            f: getattr(observation, f) for f in (
+                "timestamp", "window_id", "stage", "hero_position", "dealer_seat",
+                "active_players_count", "active_positions", "hero_cards", "board_cards",
+            )
+        })
+        observation.to_json()
+        assert observation == other
+    
+    def test_slots_keep_instances_frozen(self, observation):
+        """Test slotted observations have no __dict__ and reject new attributes."""
+        assert not hasattr(observation, "__dict__")
+        with pytest.raises((AttributeError, TypeError)):
+            observation.extra = 1
+
+
 class TestPreflopDecision:
     """Tests for PreflopDecision model."""
     
@@ -276,16 +395,12 @@ class TestCardValidation:
             Card(rank="K", suit="s"),
             Card(rank="A", suit="h"),  # Duplicate
         ]
-        unique = set(str(c) for c in cards)
+        unique = set(cards)
         assert len(unique) == 2
         assert len(cards) == 3
     
     def test_all_52_cards_valid(self):
         """Test that all 52 cards are valid."""
-        count = 0
-        for rank in "23456789TJQKA":
-            for suit in "shdc":
-                card = Card(rank=rank, suit=suit)
-                assert card.to_treys() == f"{rank}{suit}"
-                count += 1
-        assert count == 52
+        assert len(ALL_CARDS) == 52
+        for card in ALL_CARDS:
+            assert card.to_treys() == f"{card.rank}{card.suit}"
@@ -0,0 +1,67 @@
+"""
+Tests for the persistence worker.
+"""
+import pytest
+import itertools
+import json
+from datetime import datetime
+
+from src.poker.models import (
+    Card, HoleCards, BoardCards, Observation, HeroTurnEvent, Stage, Position
+)
+from src.storage.db import Database, to_epoch_us
+from src.workers.persister import PersistenceWorker
+
+# Unique names for the per-test in-memory databases
+_memory_db_ids = itertools.count()
+
+
+class TestPersistenceWorker:
+    """Tests for PersistenceWorker."""
+    
+    @pytest.fixture
+    def db(self):
+        """Create a fresh in-memory database for testing (no disk I/O)."""
+        database = Database(f"file:persister_db_{next(_memory_db_ids)}?mode=memory&cache=shared")
+        yield database
+        database.close()
+    
+    @pytest.fixture
+    def observation(self):
+        """Preflop observation with hero on the button."""
+        return Observation(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            window_id="table_1",
+            stage=Stage.PREFLOP,
+            hero_position=Position.BTN,
+            dealer_seat=0,
+            active_players_count=2,
+            active_positions=(Position.BTN, Position.BB),
+            hero_cards=HoleCards(Card("A", "h"), Card("K", "s")),
+            board_cards=BoardCards(cards=()),
+        )
+    
+    def test_hero_turn_event_written(self, db, observation):
+        """Test a queued HERO_TURN event is stored and reads back."""
+        worker = PersistenceWorker(db)
+        worker.start()
+        worker.queue_event(HeroTurnEvent(observation.timestamp, "table_1", observation))
+        worker.stop()
+        
+        events = db.get_session_events(worker.session_id, event_type="HERO_TURN")
+        assert len(events) == 1
+        assert events[0]["window_id"] == "table_1"
+        assert events[0]["ts"] == to_epoch_us(observation.timestamp)
+        assert json.loads(events[0]["payload_json"]) == observation.to_dict()
+    
+    def test_observation_written(self, db, observation):
+        """Test a queued observation is stored with its epoch-us timestamp."""
+        worker = PersistenceWorker(db)
+        worker.start()
+        worker.queue_observation(observation)
+        worker.stop()
+        
+        rows = db.get_session_observations(worker.session_id)
+        assert len(rows) == 1
+        assert rows[0]["ts"] == to_epoch_us(observation.timestamp)
+        assert rows[0]["hero_position"] == "BTN"
@@ -0,0 +1,117 @@
+"""
+Tests for the state poller's per-window polling.
+"""
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.app.config import Region
+from src.poker.models import (
+    Card, HoleCards, BoardCards, Observation, Stage, Position
+)
+from src.workers.poller import StatePoller, CardLayout
+
+# First board slot in the test layout
+BOARD_SLOT = Region(10, 10, 20, 20)
+
+
+class TestSteadyStatePolling:
+    """Tests for the decided-hand fast path in StatePoller._poll_window."""
+    
+    @pytest.fixture
+    def frame(self):
+        """Dark full-window frame (empty board)."""
+        return np.zeros((100, 100, 3), dtype=np.uint8)
+    
+    @pytest.fixture
+    def poller(self, frame):
+        """Poller with one window mid-hand, preflop decision already made."""
+        poller = StatePoller()
+        poller._frame_source = MagicMock()
+        poller._frame_source.crop_window.return_value = frame
+        
+        detector = MagicMock()
+        detector.get_full_state.return_value = {
+            "dealer": SimpleNamespace(seat_index=0, confidence=1.0),
+            "active_players": SimpleNamespace(active_seats=[2, 5], count=2),
+            "hero_turn": SimpleNamespace(is_hero_turn=True, confidence=1.0),
+        }
+        detector.detect_hand_id.return_value = SimpleNamespace(hand_id="h1", is_new_hand=False)
+        detector.detect_hero_stack.return_value = SimpleNamespace(stack_bb=50.0)
+        poller._ui_detectors["table_1"] = detector
+        poller._card_layouts["table_1"] = CardLayout(
+            hero_ranks=(Region(0, 0, 5, 5), Region(5, 0, 5, 5)),
+            hero_suits=((0, 0), (5, 0)),
+            board=((BOARD_SLOT, (15, 35)),),
+        )
+        
+        cards = HoleCards(Card("A", "h"), Card("K", "s"))
+        state = poller._get_or_create_state("table_1")
+        state.final_cards = cards
+        state.final_decision = object()
+        state.last_observation = Observation(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            window_id="table_1",
+            stage=Stage.PREFLOP,
+            hero_position=Position.BTN,
+            dealer_seat=0,
+            active_players_count=4,
+            active_positions=(Position.BTN, Position.SB, Position.BB, Position.UTG),
+            hero_cards=cards,
+            board_cards=BoardCards.empty(),
+        )
+        return poller
+    
+    @pytest.fixture
+    def window(self):
+        """Registered-window stand-in at the screen origin."""
+        info = SimpleNamespace(get_screen_offset=lambda: (0, 0), client_size=(100, 100))
+        return SimpleNamespace(window_id="table_1", info=info, config=None)
+    
+    def test_preflop_fast_path_refreshes_seats(self, poller, window):
+        """Test the fast path skips board OCR but picks up folded seats."""
+        poller._recognize_board_cards = MagicMock()
+        
+        observation = poller._poll_window(window)
+        
+        poller._recognize_board_cards.assert_not_called()
+        assert observation.stage == Stage.PREFLOP
+        assert observation.is_hero_turn
+        assert observation.active_players_count == 3
+        assert len(observation.active_positions) == 3
+    
+    def test_flop_leaves_fast_path(self, poller, window, frame):
+        """Test a card in the first board slot triggers a full poll with the flop."""
+        flop = BoardCards(cards=(Card("Q", "d"), Card("7", "c"), Card("2", "h")))
+        poller._recognize_board_cards = MagicMock(return_value=flop)
+        frame[BOARD_SLOT.top:BOARD_SLOT.top + BOARD_SLOT.height,
+              BOARD_SLOT.left:BOARD_SLOT.left + BOARD_SLOT.width] = 255
+        
+        observation = poller._poll_window(window)
+        
+        poller._recognize_board_cards.assert_called_once()
+        assert observation.stage == Stage.FLOP
+        assert observation.board_cards == flop
+        assert observation.hero_stack_bb == 50.0
+
+
+class TestPollerShutdown:
+    """Tests for StatePoller.stop cleanup."""
+    
+    def test_stop_releases_detector_ocr(self):
+        """Test stop() ends each detector's tesserocr API."""
+        from src.vision.ui_state import UIStateDetector
+        
+        poller = StatePoller()
+        detector = UIStateDetector(poller.table_config, poller._capture)
+        tess = MagicMock()
+        detector._tess = tess
+        poller._ui_detectors["table_1"] = detector
+        
+        poller.stop()
+        
+        tess.End.assert_called_once()
+        assert detector._tess is None
@@ -4,7 +4,8 @@ Tests for position calculation.
 import pytest
 
 from src.poker.positions import (
-    get_position_from_seat, get_hero_position, get_active_positions,
+    get_position_from_seat, get_positions_for_table, get_hero_position,
+    get_active_positions,
     is_position_late, is_position_blind, is_position_early
 )
 from src.poker.models import Position
@@ -13,56 +14,42 @@ from src.poker.models import Position
 class TestPositionFromSeat:
     """Tests for seat to position mapping."""
     
-    def test_dealer_is_btn(self):
-        """Test that dealer seat is BTN."""
-        pos = get_position_from_seat(seat_index=0, dealer_seat=0)
-        assert pos == Position.BTN
-    
-    def test_next_to_dealer_is_sb(self):
-        """Test that seat after dealer is SB."""
-        pos = get_position_from_seat(seat_index=1, dealer_seat=0)
-        assert pos == Position.SB
-    
-    def test_two_after_dealer_is_bb(self):
-        """Test that 2 seats after dealer is BB."""
-        pos = get_position_from_seat(seat_index=2, dealer_seat=0)
-        assert pos == Position.BB
-    
-    def test_utg_position(self):
-        """Test UTG position (3 after dealer)."""
-        pos = get_position_from_seat(seat_index=3, dealer_seat=0)
-        assert pos == Position.UTG
-    
-    def test_wrap_around(self):
-        """Test position calculation with wrap-around."""
-        # Dealer at seat 6, hero at seat 0
-        # (0 - 6) % 8 = 2 -> BB
-        pos = get_position_from_seat(seat_index=0, dealer_seat=6, total_seats=8)
-        assert pos == Position.BB
-    
-    def test_dealer_at_seat_4(self):
-        """Test with dealer at different seat."""
-        # Seat 4 is dealer (BTN)
-        pos = get_position_from_seat(seat_index=4, dealer_seat=4)
-        assert pos == Position.BTN
-        
-        # Seat 5 is SB
-        pos = get_position_from_seat(seat_index=5, dealer_seat=4)
-        assert pos == Position.SB
+    @pytest.mark.parametrize("seat,dealer,expected", [
+        (0, 0, Position.BTN),  # Dealer seat is BTN
+        (1, 0, Position.SB),   # Seat after dealer is SB
+        (2, 0, Position.BB),   # 2 seats after dealer is BB
+        (3, 0, Position.UTG),  # 3 seats after dealer is UTG
+        (0, 6, Position.BB),   # Wrap-around: (0 - 6) % 8 = 2 -> BB
+        (4, 4, Position.BTN),  # Dealer at a different seat
+        (5, 4, Position.SB),
+    ])
+    def test_position_from_seat(self, seat, dealer, expected):
+        """Test seat to position mapping on a full 8-seat table."""
+        assert get_position_from_seat(seat_index=seat, dealer_seat=dealer, total_seats=8) == expected
     
     def test_6max_positions(self):
         """Test 6-max table positions."""
-        dealer_seat = 0
+        positions = get_positions_for_table(dealer_seat=0, total_seats=6)
         
-        positions = []
-        for seat in range(6):
-            pos = get_position_from_seat(seat, dealer_seat, total_seats=6)
-            positions.append(pos)
-        
-        assert positions[0] == Position.BTN
-        assert positions[1] == Position.SB
-        assert positions[2] == Position.BB
-        assert positions[3] == Position.UTG
+        assert positions == (
+            Position.BTN, Position.SB, Position.BB,
+            Position.UTG, Position.HJ, Position.CO,
+        )
+    
+    @pytest.mark.parametrize("total_seats", range(1, 10))
+    def test_positions_for_table_match_per_seat(self, total_seats):
+        """Test the precomputed table agrees with per-seat lookups."""
+        for dealer in range(total_seats):
+            expected = tuple(
+                get_position_from_seat(seat, dealer, total_seats)
+                for seat in range(total_seats)
+            )
+            assert get_positions_for_table(dealer, total_seats) == expected
+    
+    def test_positions_for_table_invalid_size(self):
+        """Test unsupported table sizes give no positions."""
+        assert get_positions_for_table(0, total_seats=0) == ()
+        assert get_positions_for_table(0, total_seats=10) == ()
     
     def test_invalid_total_seats(self):
         """Test invalid seat count returns UNKNOWN."""
@@ -115,6 +102,15 @@ class TestActivePositions:
         
         assert Position.BTN in positions
         assert Position.UTG1 in positions
+    
+    def test_cached_tuple_variant_matches_list(self):
+        """Test cached tuple variant agrees with the list API and is reused."""
+        from src.poker.positions import get_active_positions_tuple
+        
+        result = get_active_positions_tuple((0, 4, 7), 0)
+        
+        assert list(result) == get_active_positions([0, 4, 7], 0)
+        assert get_active_positions_tuple((0, 4, 7), 0) is result
 
 
 class TestPositionCategories:
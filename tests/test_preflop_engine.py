@@ -9,11 +9,14 @@ from src.poker.models import (
     Observation, Card, HoleCards, BoardCards, Stage, Position, Action
 )
 
+# Fixed timestamp - decisions never depend on wall-clock time
+TEST_TIMESTAMP = datetime(2024, 1, 1)
+
 
 def make_observation(hole_cards: HoleCards, stage: Stage = Stage.PREFLOP) -> Observation:
     """Helper to create test observations."""
     return Observation(
-        timestamp=datetime.now(),
+        timestamp=TEST_TIMESTAMP,
         window_id="test_window",
         stage=stage,
         hero_position=Position.BTN,
@@ -141,7 +144,7 @@ class TestPlaceholderEngine:
         """Test that missing hole cards returns None."""
         engine = PlaceholderPreflopEngine()
         obs = Observation(
-            timestamp=datetime.now(),
+            timestamp=TEST_TIMESTAMP,
             window_id="test",
             stage=Stage.PREFLOP,
             hero_position=Position.BTN,
@@ -168,7 +171,7 @@ class TestPlaceholderEngine:
         ))
         
         obs = Observation(
-            timestamp=datetime.now(),
+            timestamp=TEST_TIMESTAMP,
             window_id="test",
             stage=Stage.FLOP,
             hero_position=Position.BTN,
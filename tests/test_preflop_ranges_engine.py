@@ -19,6 +19,7 @@ from src.poker.preflop_engine import (
     create_engine,
     position_to_key,
     get_action_index,
+    active_positions_mask,
     ActionSituation,
 )
 from src.poker.preflop_ranges import (
@@ -29,14 +30,17 @@ from src.poker.preflop_ranges import (
     is_short_stack,
 )
 
+# Fixed timestamp - decisions never depend on wall-clock time
+TEST_TIMESTAMP = datetime(2024, 1, 1)
+
 
 # -----------------------------------------------------------------------------
 # Fixtures
 # -----------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine():
-    """Create a RangesBasedEngine instance."""
+    """Create a RangesBasedEngine instance (stateless apart from its decision memo)."""
     return RangesBasedEngine()
 
 
@@ -51,7 +55,7 @@ def make_observation(
     card2 = Card(rank=hero_cards[1][0], suit=hero_cards[1][1])
     
     return Observation(
-        timestamp=datetime.now(),
+        timestamp=TEST_TIMESTAMP,
         window_id="test",
         stage=Stage.PREFLOP,
         hero_position=hero_position,
@@ -102,6 +106,13 @@ class TestPositionMapping:
         assert get_action_index("UTG+1") == 1
         assert get_action_index("BB") == 8
         assert get_action_index("invalid") == -1
+    
+    def test_active_positions_mask(self):
+        """Test positions pack into action-order bits (aliases included)."""
+        assert active_positions_mask(()) == 0
+        assert active_positions_mask((Position.UTG, Position.BB)) == 0b100000001
+        assert active_positions_mask((Position.MP,)) == active_positions_mask((Position.UTG2,))
+        assert active_positions_mask((Position.UNKNOWN,)) == 0
 
 
 # -----------------------------------------------------------------------------
@@ -134,6 +145,62 @@ class TestRFIDecisions:
         assert decision is not None
         assert decision.action == Action.FOLD
     
+    def test_repeated_spot_is_cached(self, engine):
+        """Identical spots should reuse the memoized decision."""
+        obs = make_observation(
+            hero_cards=(("A", "s"), ("K", "s")),
+            hero_position=Position.UTG,
+        )
+        first = engine.get_decision(obs)
+        second = engine.get_decision(obs)
+        
+        assert second is first
+    
+    def test_cache_keyed_on_stack_bucket(self, engine):
+        """Stacks in the same bucket should hit the same cache entry."""
+        decisions = [
+            engine.get_decision(make_observation(
+                hero_cards=(("Q", "s"), ("J", "s")),
+                hero_position=Position.CO,
+                hero_stack_bb=stack,
+            ))
+            for stack in (50.04, 63.2, 100.0)
+        ]
+        
+        assert decisions[0] is decisions[1] is decisions[2]
+    
+    def test_push_fold_not_cached_across_stacks(self, engine):
+        """Push/fold sizing should follow the exact stack."""
+        pushes = [
+            engine.get_decision(make_observation(
+                hero_cards=(("A", "s"), ("A", "h")),
+                hero_position=Position.BTN,
+                hero_stack_bb=stack,
+            ))
+            for stack in (7.5, 8.0)
+        ]
+        
+        assert [d.sizing_bb for d in pushes] == [7.5, 8.0]
+    
+    def test_engine_has_no_reference_cycle(self):
+        """A dropped engine should be freed without waiting for the GC."""
+        import gc
+        import weakref
+        
+        engine = RangesBasedEngine()
+        engine.get_decision(make_observation(
+            hero_cards=(("A", "s"), ("K", "s")),
+            hero_position=Position.UTG,
+        ))
+        ref = weakref.ref(engine)
+        
+        gc.disable()
+        try:
+            del engine
+            assert ref() is None
+        finally:
+            gc.enable()
+
     def test_btn_open_wide(self, engine):
         """BTN should open wider range."""
         # K7o is in BTN open range but not UTG
@@ -175,7 +242,7 @@ class TestRFIDecisions:
 # Defense vs Open tests
 # -----------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def full_engine():
     """Create a RangesBasedEngine with rfi_only_mode=False."""
     return RangesBasedEngine(rfi_only_mode=False)
@@ -309,7 +376,7 @@ class TestEdgeCases:
     def test_not_preflop_returns_none(self, engine):
         """Engine should return None for non-preflop stages."""
         obs = Observation(
-            timestamp=datetime.now(),
+            timestamp=TEST_TIMESTAMP,
             window_id="test",
             stage=Stage.FLOP,  # Not preflop
             hero_position=Position.BTN,
@@ -333,7 +400,7 @@ class TestEdgeCases:
     def test_no_hero_cards_returns_none(self, engine):
         """Engine should return None without hero cards."""
         obs = Observation(
-            timestamp=datetime.now(),
+            timestamp=TEST_TIMESTAMP,
             window_id="test",
             stage=Stage.PREFLOP,
             hero_position=Position.BTN,
@@ -485,18 +552,40 @@ class TestRFIOnlyMode:
 # Range data validation
 # -----------------------------------------------------------------------------
 
+def _is_valid_hand(hand: str) -> bool:
+    """Check 'AA' / 'AKs' / 'AKo' notation."""
+    valid_ranks = "23456789TJQKA"
+    if len(hand) == 2:
+        return hand[0] in valid_ranks and hand[1] in valid_ranks
+    return (
+        len(hand) == 3
+        and hand[0] in valid_ranks
+        and hand[1] in valid_ranks
+        and hand[2] in "so"
+    )
+
+
+@pytest.fixture(scope="session")
+def open_range_stats():
+    """Scan OPEN_RANGES once: {position: (hand count, invalid hands)}."""
+    return {
+        pos: (len(range_set), sorted(h for h in range_set if not _is_valid_hand(h)))
+        for pos, range_set in OPEN_RANGES.items()
+    }
+
+
 class TestRangeDataValidation:
     """Tests to validate range data integrity."""
     
-    def test_all_open_positions_have_ranges(self):
+    def test_all_open_positions_have_ranges(self, open_range_stats):
         """All expected positions should have open ranges."""
         expected = {"UTG", "UTG+1", "UTG+2", "LJ", "HJ", "CO", "BTN", "SB"}
-        assert set(OPEN_RANGES.keys()) == expected
+        assert set(open_range_stats) == expected
     
-    def test_open_ranges_not_empty(self):
+    def test_open_ranges_not_empty(self, open_range_stats):
         """Open ranges should not be empty."""
-        for pos, range_set in OPEN_RANGES.items():
-            assert len(range_set) > 0, f"Empty range for {pos}"
+        for pos, (count, _) in open_range_stats.items():
+            assert count > 0, f"Empty range for {pos}"
     
     def test_defense_ranges_structure(self):
         """Defense ranges should have correct structure."""
@@ -505,20 +594,7 @@ class TestRangeDataValidation:
                 assert "3bet" in actions, f"Missing 3bet for {def_pos} vs {open_pos}"
                 assert "call" in actions, f"Missing call for {def_pos} vs {open_pos}"
     
-    def test_hand_notation_format(self):
+    def test_hand_notation_format(self, open_range_stats):
         """All hands should be in valid notation format."""
-        valid_ranks = set("23456789TJQKA")
-        
-        for pos, range_set in OPEN_RANGES.items():
-            for hand in range_set:
-                assert 2 <= len(hand) <= 3, f"Invalid hand length: {hand}"
-                
-                if len(hand) == 2:
-                    # Pair: "AA", "KK", etc.
-                    assert hand[0] in valid_ranks, f"Invalid rank in {hand}"
-                    assert hand[1] in valid_ranks, f"Invalid rank in {hand}"
-                else:
-                    # Suited/offsuit: "AKs", "AKo"
-                    assert hand[0] in valid_ranks, f"Invalid rank in {hand}"
-                    assert hand[1] in valid_ranks, f"Invalid rank in {hand}"
-                    assert hand[2] in "so", f"Invalid suffix in {hand}"
+        for pos, (_, invalid) in open_range_stats.items():
+            assert not invalid, f"Invalid hands for {pos}: {invalid}"
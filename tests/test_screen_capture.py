@@ -0,0 +1,84 @@
+"""
+Tests for background frame capture.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.capture import screen_capture
+from src.capture.screen_capture import LatestFrameCapture
+
+
+def _fake_mss(monitors):
+    """mss.mss() stand-in reporting the given monitors (index 0 = union)."""
+    sct = MagicMock()
+    sct.__enter__.return_value = sct
+    sct.monitors = monitors
+    return MagicMock(return_value=sct)
+
+
+PRIMARY = {"left": 0, "top": 0, "width": 1920, "height": 1080}
+LEFT_OF_PRIMARY = {"left": -1280, "top": 0, "width": 1280, "height": 1024}
+
+
+class TestLatestFrameCaptureBackend:
+    """Tests for bettercam/mss backend selection."""
+    
+    @pytest.fixture
+    def bettercam(self, monkeypatch):
+        """Pretend bettercam is installed."""
+        camera_module = MagicMock()
+        monkeypatch.setattr(screen_capture, "HAS_BETTERCAM", True)
+        monkeypatch.setattr(screen_capture, "bettercam", camera_module, raising=False)
+        return camera_module
+    
+    def test_single_monitor_uses_bettercam(self, bettercam, monkeypatch):
+        """Test bettercam is used when there is only one monitor."""
+        monkeypatch.setattr(screen_capture.mss, "mss", _fake_mss([PRIMARY, PRIMARY]))
+        capture = LatestFrameCapture()
+        
+        capture.start()
+        
+        bettercam.create.assert_called_once()
+        assert capture._thread is None
+        capture.stop()
+    
+    def test_multiple_monitors_fall_back_to_mss(self, bettercam, monkeypatch):
+        """Test several monitors use mss over the virtual screen instead."""
+        union = {"left": -1280, "top": 0, "width": 3200, "height": 1080}
+        monkeypatch.setattr(
+            screen_capture.mss, "mss", _fake_mss([union, PRIMARY, LEFT_OF_PRIMARY])
+        )
+        monkeypatch.setattr(LatestFrameCapture, "_grab_loop", lambda self: None)
+        capture = LatestFrameCapture()
+        
+        capture.start()
+        
+        bettercam.create.assert_not_called()
+        assert capture._camera is None
+        capture.stop()
+
+
+class TestLatestFrameCrop:
+    """Tests for cropping windows out of the latest frame."""
+    
+    def test_crop_translates_by_frame_origin(self):
+        """Test window offsets are made relative to the frame's screen origin."""
+        capture = LatestFrameCapture()
+        frame = np.zeros((1024, 3200, 3), dtype=np.uint8)
+        frame[10:20, 100:130] = 255
+        capture._latest = (frame, (-1280, 0))
+        
+        crop = capture.crop_window((-1180, 10), (30, 10))
+        
+        assert crop.shape == (10, 30, 3)
+        assert (crop == 255).all()
+    
+    def test_crop_outside_frame_is_none(self):
+        """Test windows not fully inside the frame fall back to direct capture."""
+        capture = LatestFrameCapture()
+        capture._latest = (np.zeros((1080, 1920, 3), dtype=np.uint8), (0, 0))
+        
+        assert capture.crop_window((-100, 0), (200, 200)) is None
+        assert capture.crop_window((1900, 0), (200, 200)) is None
@@ -2,11 +2,16 @@
 Tests for database storage.
 """
 import pytest
+import itertools
+import json
 import tempfile
 from pathlib import Path
 from datetime import datetime
 
-from src.storage.db import Database
+from src.storage.db import Database, to_epoch_us
+
+# Unique names for the per-test in-memory databases
+_memory_db_ids = itertools.count()
 
 
 class TestDatabase:
@@ -14,16 +19,16 @@ class TestDatabase:
     
     @pytest.fixture
     def db(self):
-        """Create a temporary database for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            database = Database(db_path)
-            yield database
-            database.close()
+        """Create a fresh in-memory database for testing (no disk I/O)."""
+        database = Database(f"file:test_db_{next(_memory_db_ids)}?mode=memory&cache=shared")
+        yield database
+        database.close()
     
-    def test_database_initialization(self, db):
+    def test_database_initialization(self, tmp_path):
         """Test database can be initialized."""
+        db = Database(tmp_path / "test.db")
         assert db.db_path.exists()
+        db.close()
     
     def test_create_session(self, db):
         """Test creating a session."""
@@ -115,39 +120,134 @@ class TestDatabase:
         assert decision_id is not None
         assert decision_id > 0
     
+    def test_insert_observation_serializes_json_values(self, db):
+        """Test list/dict *_json values are encoded and strings kept as-is."""
+        session_id = db.create_session()
+        db.insert_observation(
+            session_id, "table_1", datetime.now(), "preflop", 0, "BTN", 2,
+            ["BTN", "BB"], "AhKs", '["Qd"]', 1.5, {"hero_cards": 0.9}
+        )
+        
+        obs = db.get_session_observations(session_id)[0]
+        assert json.loads(obs["active_positions_json"]) == ["BTN", "BB"]
+        assert obs["hero_cards_json"] == "AhKs"
+        assert obs["board_cards_json"] == '["Qd"]'
+        assert json.loads(obs["raw_confidence_json"]) == {"hero_cards": 0.9}
+    
+    def test_timestamps_stored_as_epoch_us(self, db):
+        """Test datetime and int timestamps both land as INTEGER microseconds."""
+        session_id = db.create_session()
+        now = datetime.now()
+        
+        db.insert_event(session_id, "table_1", now, "HERO_TURN", None)
+        db.insert_event(session_id, "table_1", 1_700_000_000_000_000, "HERO_TURN", None)
+        
+        ts_values = [e["ts"] for e in db.get_session_events(session_id)]
+        assert ts_values == [to_epoch_us(now), 1_700_000_000_000_000]
+        assert to_epoch_us(now) == int(now.timestamp() * 1_000_000)
+    
+    def test_insert_observations_bulk(self, db):
+        """Test inserting several observations at once."""
+        session_id = db.create_session()
+        ts = to_epoch_us(datetime.now())
+        rows = [
+            (session_id, f"table_{i}", ts, "preflop", i, "BTN", 6,
+             '["BTN"]', "AhKs", "[]", 1.5, None)
+            for i in range(5)
+        ]
+        
+        assert db.insert_observations_bulk(rows) == 5
+        assert db.insert_observations_bulk([]) == 0
+        
+        observations = db.get_session_observations(session_id)
+        assert len(observations) == 5
+        assert {o["window_id"] for o in observations} == {f"table_{i}" for i in range(5)}
+    
     def test_get_session_observations(self, db):
         """Test retrieving observations."""
         session_id = db.create_session()
         
-        # Insert some observations
-        for i in range(5):
-            db.insert_observation(
-                session_id=session_id,
-                window_id="table_1",
-                timestamp=datetime.now(),
-                stage="preflop",
-                dealer_seat=i,
-                hero_position="BTN",
-                active_players_count=4,
-                active_positions_json='[]',
-                hero_cards_json='[]',
-                board_cards_json='[]',
-                pot_bb=1.5,
-                raw_confidence_json=None
-            )
+        # Insert some observations in one transaction
+        ts = to_epoch_us(datetime.now())
+        db.insert_observations_bulk([
+            (session_id, "table_1", ts, "preflop", i, "BTN", 4,
+             '[]', '[]', '[]', 1.5, None)
+            for i in range(5)
+        ])
         
         observations = db.get_session_observations(session_id, limit=10)
         
         assert len(observations) == 5
+        
+        raw = db.get_session_observations(session_id, limit=10, raw=True)
+        assert len(raw) == 5
+        assert all(type(row) is tuple for row in raw)
+        assert sorted(row[5] for row in raw) == [0, 1, 2, 3, 4]  # dealer_seat
+        # Row factory is only bypassed for that one query
+        assert isinstance(db.get_session_observations(session_id)[0], dict)
+    
+    def test_row_converters_match_row_dicts(self, db):
+        """Test per-table row converters build the same dicts as sqlite3.Row."""
+        session_id = db.create_session()
+        db.insert_decision(session_id, "table_1", datetime.now(), "preflop",
+                           "BTN", "raise", "ranges", 0.9)
+        
+        conn = db._get_connection()
+        expected = [dict(row) for row in conn.execute("SELECT * FROM decisions")]
+        
+        assert set(db._row_converters) == {"observations", "events", "decisions"}
+        assert db.get_session_decisions(session_id) == expected
+        assert list(db.get_session_decisions(session_id)[0]) == list(expected[0])
+    
+    def test_bulk_insert_rolls_back_on_error(self, db):
+        """Test a failing row leaves none of its batch behind."""
+        import sqlite3
+        
+        session_id = db.create_session()
+        ts = to_epoch_us(datetime.now())
+        rows = [(session_id, "table_1", ts, "HERO_TURN", None), (session_id, "bad_row")]
+        
+        with pytest.raises(sqlite3.Error):
+            db.insert_events_bulk(rows)
+        assert db.get_session_events(session_id) == []
+        
+        # Connection stays usable after the rollback
+        assert db.insert_events_bulk(rows[:1]) == 1
+    
+    def test_insert_events_bulk(self, db):
+        """Test inserting several events at once."""
+        session_id = db.create_session()
+        ts = to_epoch_us(datetime.now())
+        rows = [(session_id, "table_1", ts, "HERO_TURN", None) for _ in range(3)]
+        
+        assert db.insert_events_bulk(rows) == 3
+        assert db.insert_events_bulk([]) == 0
+        assert len(db.get_session_events(session_id, event_type="HERO_TURN")) == 3
+    
+    def test_insert_events_bulk_spans_statements(self, db):
+        """Test batches larger than one multi-row statement are fully stored."""
+        from src.storage.db import EVENTS_PER_STATEMENT
+        
+        session_id = db.create_session()
+        ts = to_epoch_us(datetime.now())
+        count = EVENTS_PER_STATEMENT * 2 + 7
+        rows = [(session_id, f"table_{i}", ts, "HERO_TURN", None) for i in range(count)]
+        
+        assert db.insert_events_bulk(rows) == count
+        events = db.get_session_events(session_id, limit=count + 1)
+        assert {e["window_id"] for e in events} == {f"table_{i}" for i in range(count)}
     
     def test_get_session_events(self, db):
         """Test retrieving events."""
         session_id = db.create_session()
         
-        # Insert events
-        db.insert_event(session_id, "table_1", datetime.now(), "HERO_TURN", None)
-        db.insert_event(session_id, "table_1", datetime.now(), "HERO_TURN", None)
-        db.insert_event(session_id, "table_1", datetime.now(), "OTHER", None)
+        # Insert events in one statement
+        ts = to_epoch_us(datetime.now())
+        db.insert_events_bulk([
+            (session_id, "table_1", ts, "HERO_TURN", None),
+            (session_id, "table_1", ts, "HERO_TURN", None),
+            (session_id, "table_1", ts, "OTHER", None),
+        ])
         
         all_events = db.get_session_events(session_id)
         assert len(all_events) == 3
@@ -155,6 +255,50 @@ class TestDatabase:
         hero_events = db.get_session_events(session_id, event_type="HERO_TURN")
         assert len(hero_events) == 2
     
+    def test_session_queries_use_composite_indexes(self, db):
+        """Test per-session reads are index range scans with no sort step."""
+        conn = db._get_connection()
+        queries = [
+            ("SELECT * FROM observations WHERE session_id = ? ORDER BY ts DESC LIMIT ?",
+             (1, 10), "idx_observations_session_ts"),
+            ("SELECT * FROM events WHERE session_id = ? AND type = ? ORDER BY ts DESC LIMIT ?",
+             (1, "HERO_TURN", 10), "idx_events_session_type_ts"),
+            ("SELECT * FROM events WHERE session_id = ? ORDER BY ts DESC LIMIT ?",
+             (1, 10), "idx_events_session_ts"),
+        ]
+        
+        for sql, params, index in queries:
+            plan = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+            assert index in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
+    
+    def test_bulk_load_defers_indexes(self, db):
+        """Test bulk_load drops secondary indexes and rebuilds them after."""
+        conn = db._get_connection()
+        index_sql = "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        before = {row[0] for row in conn.execute(index_sql)}
+        session_id = db.create_session()
+        ts = to_epoch_us(datetime.now())
+        
+        with db.bulk_load():
+            assert not {row[0] for row in conn.execute(index_sql)} & before
+            db.insert_events_bulk([
+                (session_id, "table_1", ts + i, "HERO_TURN", None) for i in range(10)
+            ])
+        
+        assert {row[0] for row in conn.execute(index_sql)} == before
+        assert len(db.get_session_events(session_id, event_type="HERO_TURN")) == 10
+    
+    def test_writes_begin_immediate(self, db):
+        """Test write transactions take the SQLite write lock up front."""
+        statements = []
+        db._get_connection().set_trace_callback(statements.append)
+        
+        db.create_session()
+        
+        assert "BEGIN IMMEDIATE" in statements
+        assert statements[-1] == "COMMIT"
+    
     def test_get_stats(self, db):
         """Test getting database statistics."""
         session_id = db.create_session()
@@ -169,11 +313,136 @@ class TestDatabase:
         assert stats["sessions"] >= 1
         assert stats["observations"] >= 1
         assert stats["events"] >= 1
+    
+    def test_get_stats_tracks_inserts(self, db):
+        """Test cached counts follow later inserts and match COUNT(*)."""
+        session_id = db.create_session()
+        before = db.get_stats()
+        
+        ts = to_epoch_us(datetime.now())
+        db.insert_events_bulk([(session_id, "table_1", ts, "TEST", None)] * 3)
+        db.insert_decision(session_id, "table_1", datetime.now(), "preflop", "BTN", "fold", None, None)
+        with pytest.raises(Exception):
+            db.insert_events_bulk([(session_id, "bad_row")])
+        
+        stats = db.get_stats()
+        assert stats["events"] == before["events"] + 3
+        assert stats["decisions"] == before["decisions"] + 1
+        
+        conn = db._get_connection()
+        for table, count in stats.items():
+            assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == count
+    
+    def test_get_stats_sees_other_writers(self, tmp_path):
+        """Test cached counts are re-read after another connection commits."""
+        db_path = tmp_path / "test.db"
+        a, b = Database(db_path), Database(db_path)
+        assert a.get_stats()["sessions"] == 0
+        
+        b.create_session()
+        b.create_session()
+        assert a.get_stats()["sessions"] == 2
+        
+        a.create_session()
+        assert a.get_stats()["sessions"] == 3
+        a.close()
+        b.close()
+    
+    def test_write_pragmas_applied_by_default(self, tmp_path):
+        """Test a new database opens in WAL mode with the tuned settings."""
+        db = Database(tmp_path / "test.db")
+        conn = db._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    
+    def test_migrates_v1_iso_timestamps(self, tmp_path):
+        """Test a schema v1 file (ISO TEXT ts) is upgraded to INTEGER epoch-us."""
+        import sqlite3
+        from src.storage.db import SCHEMA_PATH, SCHEMA_VERSION
+        
+        db_path = tmp_path / "v1.db"
+        v1_schema = SCHEMA_PATH.read_text().replace("ts INTEGER NOT NULL", "ts TEXT NOT NULL")
+        older, newer = datetime(2024, 1, 1, 12, 0, 0, 250), datetime(2024, 1, 2, 9, 30)
+        conn = sqlite3.connect(db_path)
+        conn.executescript(v1_schema)
+        conn.execute("INSERT INTO sessions (id) VALUES (1)")
+        conn.executemany(
+            "INSERT INTO events (session_id, window_id, ts, type) VALUES (1, 't', ?, 'HERO_TURN')",
+            [(older.isoformat(),), (newer.isoformat(),)]
+        )
+        conn.commit()
+        conn.close()
+        
+        db = Database(db_path)
+        db.insert_event(1, "t", datetime(2024, 1, 1, 18, 0), "HERO_TURN", None)
+        
+        conn = db._get_connection()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert [row[0] for row in conn.execute("SELECT DISTINCT typeof(ts) FROM events")] == ["integer"]
+        assert [e["ts"] for e in db.get_session_events(1)] == [
+            to_epoch_us(newer), to_epoch_us(datetime(2024, 1, 1, 18, 0)), to_epoch_us(older)
+        ]
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM events WHERE session_id = 1 ORDER BY ts DESC"
+        ))
+        assert "idx_events_session_ts" in plan
+        db.close()
+        
+        # Reopening a migrated file leaves it alone
+        db = Database(db_path)
+        assert len(db.get_session_events(1)) == 3
+        db.close()
+    
+    def test_enable_write_pragmas(self, tmp_path):
+        """Test WAL mode is applied to existing and new thread connections."""
+        import threading
+        
+        db = Database(tmp_path / "test.db", write_pragmas=False)
+        db.enable_write_pragmas()
+        conn = db._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        
+        results = []
+        
+        def worker():
+            thread_conn = db._get_connection()
+            results.append(thread_conn.execute("PRAGMA synchronous").fetchone()[0])
+            db.close()
+        
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        
+        assert results == [1]
+
 
 
 class TestDatabaseThreadSafety:
     """Tests for database thread safety."""
     
+    def test_shared_memory_database_across_threads(self):
+        """Test a shared-cache URI gives every thread the same in-memory data."""
+        import threading
+        
+        db = Database(f"file:test_db_{next(_memory_db_ids)}?mode=memory&cache=shared")
+        session_id = db.create_session()
+        results = []
+        
+        def worker():
+            results.append(len(db.get_session_observations(session_id)))
+            results.append(db._get_connection().execute(
+                "SELECT COUNT(*) FROM sessions").fetchone()[0])
+            db.close()
+        
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        db.close()
+        
+        assert results == [0, 1]
+    
     def test_multiple_connections(self):
         """Test that connections work across multiple threads."""
         import concurrent.futures
@@ -207,3 +476,22 @@ class TestDatabaseThreadSafety:
                 shutil.rmtree(tmpdir, ignore_errors=True)
             except Exception:
                 pass  # Ignore cleanup errors on Windows
+    
+    def test_separate_writers_same_file(self, tmp_path):
+        """Test two Database objects on one file write concurrently without 'locked'."""
+        import concurrent.futures
+        
+        db_path = tmp_path / "test.db"
+        writers = [Database(db_path), Database(db_path)]
+        
+        def worker(worker_id):
+            db = writers[worker_id % 2]
+            return [db.create_session(notes=f"Worker {worker_id}") for _ in range(5)]
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(worker, range(8)))
+        
+        session_ids = [sid for ids in results for sid in ids]
+        assert len(set(session_ids)) == 40
+        for db in writers:
+            db.close()
@@ -0,0 +1,85 @@
+"""
+Tests for pixel-based UI state detection.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.app.config import TableConfig
+from src.vision.ui_state import UIStateDetector
+
+# Full-window size covering every default probe
+CLIENT_SIZE = (1920, 1080)
+
+DEALER_GRAY = (62, 60, 64)
+CARD_BACK = (240, 238, 242)
+TURN_GREEN = (84, 208, 136)
+
+
+def _frame_capture(frame):
+    """ScreenCapture stand-in whose single-pixel reads come from frame."""
+    capture = MagicMock()
+    capture.capture_pixel.side_effect = (
+        lambda x, y, window_offset=(0, 0): tuple(int(c) for c in frame[y, x])
+    )
+    return capture
+
+
+class TestFusedProbePass:
+    """Tests that get_full_state agrees with the per-probe detectors."""
+    
+    @pytest.fixture
+    def config(self):
+        """Default 8-max table layout."""
+        return TableConfig()
+    
+    @pytest.fixture
+    def frame(self, config):
+        """Synthetic frame: dealer on seat 2, card backs on seats 1 and 6, hero to act."""
+        frame = np.zeros((CLIENT_SIZE[1], CLIENT_SIZE[0], 3), dtype=np.uint8)
+        
+        dealer = config.dealer_pixels[2]
+        frame[dealer.top, dealer.left] = DEALER_GRAY
+        
+        # active_player_pixels skips hero seat 4: list index 1 -> seat 1, 5 -> seat 6
+        for list_idx in (1, 5):
+            check = config.active_player_pixels[list_idx]
+            frame[check.top, check.left] = CARD_BACK
+        
+        turn = config.turn_indicator_pixel
+        frame[turn.top, turn.left] = TURN_GREEN
+        return frame
+    
+    @pytest.fixture
+    def detector(self, config, frame):
+        """Detector whose per-probe reads come from the synthetic frame."""
+        return UIStateDetector(config, _frame_capture(frame))
+    
+    def test_fused_matches_per_probe(self, detector, frame):
+        """Test one fused pass reports the same dealer, seats and turn."""
+        state = detector.get_full_state((0, 0), frame)
+        
+        dealer = detector.detect_dealer((0, 0))
+        active = detector.detect_active_players((0, 0))
+        turn = detector.detect_hero_turn((0, 0))
+        
+        assert state["dealer"] == dealer
+        assert state["dealer"].seat_index == 2
+        assert state["active_players"] == active
+        assert state["active_players"].active_seats == [1, 6]
+        assert state["hero_turn"] == turn
+        assert state["hero_turn"].is_hero_turn
+    
+    def test_fused_matches_per_probe_on_empty_table(self, detector, frame):
+        """Test both paths agree when no probe matches."""
+        frame[:] = 0
+        
+        state = detector.get_full_state((0, 0), frame)
+        
+        assert state["dealer"] == detector.detect_dealer((0, 0))
+        assert state["dealer"].seat_index is None
+        assert state["active_players"] == detector.detect_active_players((0, 0))
+        assert state["active_players"].count == 0
+        assert state["hero_turn"] == detector.detect_hero_turn((0, 0))
+        assert not state["hero_turn"].is_hero_turn
@@ -40,7 +40,7 @@ class TestWindowRegistry:
             )
             # Directly add to simulate discovery
             if len(registry._windows) < registry.max_windows:
-                registry._windows[table.window_id] = table
+                registry.add_window(table)
         
         assert len(registry.get_all_windows()) == 2
     
@@ -60,7 +60,7 @@ class TestWindowRegistry:
             info=info,
             config=TableConfig(),
         )
-        registry._windows["test_table"] = table
+        registry.add_window(table)
         
         result = registry.get_window("test_table")
         assert result is not None
@@ -85,7 +85,7 @@ class TestWindowRegistry:
             info=info,
             config=TableConfig(),
         )
-        registry._windows["test_table"] = table
+        registry.add_window(table)
         
         result = registry.get_window_by_hwnd(12345)
         assert result is not None
@@ -110,13 +110,14 @@ class TestWindowRegistry:
             info=info,
             config=TableConfig(),
         )
-        registry._windows["test_table"] = table
+        registry.add_window(table)
         
         assert len(registry.get_all_windows()) == 1
         
         registry.unregister_window("test_table")
         
         assert len(registry.get_all_windows()) == 0
+        assert registry.get_window_by_hwnd(12345) is None
     
     def test_get_active_windows(self):
         """Test filtering active windows."""
@@ -136,7 +137,7 @@ class TestWindowRegistry:
                 config=TableConfig(),
                 is_active=is_active,
             )
-            registry._windows[table.window_id] = table
+            registry.add_window(table)
         
         assert len(registry.get_all_windows()) == 4
         assert len(registry.get_active_windows()) == 2
@@ -160,7 +161,7 @@ class TestWindowRegistry:
             )
             # Set different error counts
             table.error_count = i * 5  # 0, 5, 10
-            registry._windows[table.window_id] = table
+            registry.add_window(table)
         
         assert len(registry.get_all_windows()) == 3
         
@@ -168,6 +169,8 @@ class TestWindowRegistry:
         
         # Only table_2 (10 errors) should be removed
         assert len(registry.get_all_windows()) == 2
+        assert registry.get_window_by_hwnd(1002) is None
+        assert registry.get_window_by_hwnd(1000) is not None
     
     def test_get_stats(self):
         """Test statistics generation."""
@@ -186,7 +189,7 @@ class TestWindowRegistry:
             config=TableConfig(),
             is_active=True,
         )
-        registry._windows["test_table"] = table
+        registry.add_window(table)
         
         stats = registry.get_stats()
         
@@ -220,6 +223,16 @@ class TestTableWindow:
         # client_left = 100 + 10 = 110
         # client_top = 50 + 30 = 80
         assert offset == (110, 80)
+        
+        # A moved window gets a new WindowInfo with its own offset
+        table.info = WindowInfo(
+            hwnd=12345,
+            title="Test",
+            rect=(200, 50, 1000, 650),
+            client_offset=(10, 30),
+            client_size=(780, 570),
+        )
+        assert table.get_screen_offset() == (210, 80)
     
     def test_mark_error(self):
         """Test error tracking."""
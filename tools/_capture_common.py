@@ -0,0 +1,68 @@
+"""
+Shared screen/cursor/keyboard helpers for the calibration tools.
+Imported by pixel_picker and template_capture when run as scripts.
+"""
+import threading
+import ctypes
+from ctypes import wintypes
+import mss
+import keyboard  # pip install keyboard
+
+# Per-monitor DPI aware (2 = PROCESS_PER_MONITOR_DPI_AWARE) before any
+# cursor or pixel read, so GetCursorPos/GetPixel use physical pixels like
+# the poller's captures. mss's constructor does the same, but the GetPixel
+# path never creates an mss instance.
+ctypes.windll.shcore.SetProcessDpiAwareness(2)
+
+# GetCursorPos with its prototype declared once, so each call in the 50 ms
+# poll loops skips ctypes' per-call argument conversion guesswork
+_GetCursorPos = ctypes.windll.user32.GetCursorPos
+_GetCursorPos.argtypes = (ctypes.POINTER(wintypes.POINT),)
+_GetCursorPos.restype = wintypes.BOOL
+
+# Reused POINT buffer - the tools poll the cursor from the main thread only
+_cursor_point = wintypes.POINT()
+
+# One mss instance reused across grabs - creating one per call sets up GDI
+# device contexts every time. mss handles are per-thread; the tools only
+# grab from the main thread.
+_sct = None
+
+
+def get_sct():
+    """Get the shared mss instance, creating it on first use."""
+    global _sct
+    if _sct is None:
+        _sct = mss.mss()
+    return _sct
+
+
+def grab(region):
+    """
+    Grab a screen region with the shared mss instance.
+
+    Args:
+        region: mss monitor dict (left, top, width, height)
+
+    Returns:
+        mss ScreenShot (BGRA)
+    """
+    return get_sct().grab(region)
+
+
+def cursor_pos():
+    """Get current cursor position as (x, y)."""
+    _GetCursorPos(_cursor_point)
+    return _cursor_point.x, _cursor_point.y
+
+
+def key_event(key):
+    """
+    Event set once per keystroke of `key`.
+
+    Hooked on release so holding the key (auto-repeat) doesn't fire twice,
+    which replaces the old sleep-based debounce.
+    """
+    event = threading.Event()
+    keyboard.on_release_key(key, lambda _: event.set())
+    return event
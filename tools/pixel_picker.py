@@ -3,25 +3,39 @@ Pixel Picker Tool - shows mouse coordinates and pixel color in real-time.
 Press Ctrl+C in terminal to exit.
 Press Space to capture current position to log.
 """
-import time
+import atexit
 import ctypes
 from ctypes import wintypes
-import mss
 import keyboard  # pip install keyboard
 
-def get_cursor_pos():
-    """Get current cursor position."""
-    point = wintypes.POINT()
-    ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
-    return point.x, point.y        
+from _capture_common import cursor_pos, grab, key_event
+
+# Screen DC held for the tool's lifetime: GetPixel reads one pixel with a
+# single GDI call instead of mss's BitBlt + buffer copy. mss is the
+# fallback if GetDC fails (NULL DC).
+CLR_INVALID = 0xFFFFFFFF
+_user32 = ctypes.windll.user32
+_gdi32 = ctypes.windll.gdi32
+_user32.GetDC.restype = wintypes.HDC
+_user32.ReleaseDC.argtypes = (wintypes.HWND, wintypes.HDC)
+_gdi32.GetPixel.argtypes = (wintypes.HDC, ctypes.c_int, ctypes.c_int)
+_gdi32.GetPixel.restype = wintypes.DWORD
+_screen_dc = _user32.GetDC(None)
+atexit.register(_user32.ReleaseDC, None, _screen_dc)
 
 def get_pixel_color(x, y):
     """Get RGB color at position."""
-    with mss.mss() as sct:
-        monitor = {"left": x, "top": y, "width": 1, "height": 1}
-        img = sct.grab(monitor)
-        pixel = img.pixel(0, 0)
-        return pixel  # (R, G, B)
+    if _screen_dc:
+        color = _gdi32.GetPixel(_screen_dc, x, y)
+        if color == CLR_INVALID:
+            raise ValueError(f"No pixel at ({x}, {y})")
+        # COLORREF is 0x00BBGGRR
+        return color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF
+    
+    monitor = {"left": x, "top": y, "width": 1, "height": 1}
+    img = grab(monitor)
+    pixel = img.pixel(0, 0)
+    return pixel  # (R, G, B)
 
 def main():
     print("=" * 60)
@@ -33,10 +47,12 @@ def main():
     print()
     
     captured = []
+    space_pressed = key_event('space')
+    esc_pressed = key_event('esc')
     
     try:
-        while True:
-            x, y = get_cursor_pos()
+        while not esc_pressed.is_set():
+            x, y = cursor_pos()
             try:
                 r, g, b = get_pixel_color(x, y)
                 color_str = f"RGB({r:3d}, {g:3d}, {b:3d})"
@@ -46,20 +62,19 @@ def main():
             # Print on same line
             print(f"\rX: {x:5d}  Y: {y:5d}  {color_str}    ", end="", flush=True)
             
-            # Check for spacebar to capture
-            if keyboard.is_pressed('space'):
+            # Spacebar captures the position shown
+            if space_pressed.is_set():
+                space_pressed.clear()
                 captured.append((x, y, color_str))
                 print(f"\n>>> CAPTURED #{len(captured)}: X={x}, Y={y}, {color_str}")
-                time.sleep(0.3)  # Debounce
-            
-            # Check for escape
-            if keyboard.is_pressed('esc'):
-                break
             
-            time.sleep(0.05)
+            # Refresh every 50 ms, or at once on the next keystroke
+            space_pressed.wait(0.05)
             
     except KeyboardInterrupt:
         pass
+    finally:
+        keyboard.unhook_all()
     
     print("\n")
     print("=" * 60)
@@ -10,26 +10,18 @@ Usage:
 6. Enter filename (e.g., "A" for Ace, "hearts" for hearts suit)
 7. Repeat for all cards/suits
 """
-import time
-import ctypes
-from ctypes import wintypes
 from pathlib import Path
-import mss
+import numpy as np
 from PIL import Image
 import keyboard
 
+from _capture_common import cursor_pos, grab, key_event
+
 # Output directories
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 NUMBER_TEMPLATES_DIR = Path(__file__).parent.parent / "number_templates"
 
 
-def get_cursor_pos():
-    """Get current cursor position."""
-    point = wintypes.POINT()
-    ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
-    return point.x, point.y
-
-
 def capture_region(x1, y1, x2, y2):
     """Capture screen region and return as PIL Image."""
     left = min(x1, x2)
@@ -37,10 +29,11 @@ def capture_region(x1, y1, x2, y2):
     width = abs(x2 - x1)
     height = abs(y2 - y1)
     
-    with mss.mss() as sct:
-        monitor = {"left": left, "top": top, "width": width, "height": height}
-        img = sct.grab(monitor)
-        return Image.frombytes("RGB", img.size, img.rgb)
+    monitor = {"left": left, "top": top, "width": width, "height": height}
+    img = grab(monitor)
+    # MSS returns BGRA - reverse the first three channels to get RGB, as
+    # ScreenCapture.capture_region_array does, instead of building img.rgb
+    return Image.fromarray(np.asarray(img)[:, :, 2::-1])
 
 
 def main():
@@ -59,40 +52,54 @@ def main():
     print("=" * 60)
     print()
     
+    space_pressed = key_event('space')
+    esc_pressed = key_event('esc')
+    try:
+        _capture_loop(space_pressed, esc_pressed)
+    finally:
+        keyboard.unhook_all()
+
+
+def _capture_loop(space_pressed, esc_pressed):
+    """Pick corners, capture and save templates until ESC."""
     while True:
+        # Keystrokes typed at the filename prompt don't count as picks
+        space_pressed.clear()
+        esc_pressed.clear()
+        
         # Wait for first point
         print("Move mouse to TOP-LEFT corner, then press SPACE...")
         while True:
-            x, y = get_cursor_pos()
+            x, y = cursor_pos()
             print(f"\rPosition: ({x}, {y})    ", end="", flush=True)
             
-            if keyboard.is_pressed('space'):
+            if space_pressed.is_set():
+                space_pressed.clear()
                 x1, y1 = x, y
                 print(f"\n>>> Start point set: ({x1}, {y1})")
-                time.sleep(0.3)
                 break
-            if keyboard.is_pressed('esc'):
+            if esc_pressed.is_set():
                 print("\nExiting...")
                 return
-            time.sleep(0.05)
+            space_pressed.wait(0.05)
         
         # Wait for second point
         print("Move mouse to BOTTOM-RIGHT corner, then press SPACE...")
         while True:
-            x, y = get_cursor_pos()
+            x, y = cursor_pos()
             w = abs(x - x1)
             h = abs(y - y1)
             print(f"\rPosition: ({x}, {y}) - Size: {w}x{h}    ", end="", flush=True)
             
-            if keyboard.is_pressed('space'):
+            if space_pressed.is_set():
+                space_pressed.clear()
                 x2, y2 = x, y
                 print(f"\n>>> End point set: ({x2}, {y2})")
-                time.sleep(0.3)
                 break
-            if keyboard.is_pressed('esc'):
+            if esc_pressed.is_set():
                 print("\nExiting...")
                 return
-            time.sleep(0.05)
+            space_pressed.wait(0.05)
         
         # Capture the region
         img = capture_region(x1, y1, x2, y2)